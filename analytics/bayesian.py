@@ -1,4 +1,4 @@
-"""Bootstrap winrate estimation. 10k iterations, 95% CI."""
+"""Balanced bootstrap winrate estimation. 5k iterations, 95% HDI."""
 
 import numpy as np
 import pandas as pd
@@ -7,6 +7,121 @@ import streamlit as st
 from typing import Optional
 from scipy import stats
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Shared PCG64 generator for the NumPy resampling path
+_RNG = np.random.default_rng()
+
+# Resample indices drawn per tile (~4 MB of int32)
+BOOTSTRAP_TILE_DRAWS = 1 << 20
+
+# multivariate_hypergeometric's 'marginals' method needs sum(colors) < 1e9,
+# so larger runs (n_hands * n_bootstrap) resample iid instead
+HYPERGEOMETRIC_MAX_POPULATION = 10**9
+
+# Below this many draws (n_bootstrap * n_hands) kernel launch overhead
+# outweighs the GPU, so device='cuda' still runs on CPU
+GPU_MIN_DRAWS = 50_000_000
+
+# Max index elements per GPU batch (~256 MB of int32 indices)
+GPU_BATCH_DRAWS = 64_000_000
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _row_means(hand_results, idx):
+        """BB/100 of each row of resample indices, rows in parallel."""
+        rows, n_hands = idx.shape
+        means = np.empty(rows, dtype=np.float32)
+        for r in prange(rows):
+            total = 0.0
+            for j in range(n_hands):
+                total += hand_results[idx[r, j]]
+            means[r] = total / n_hands * 100
+        return means
+
+
+def _cpu_bootstrap(hand_results: np.ndarray, n_bootstrap: int) -> np.ndarray:
+    """Balanced bootstrap: every hand appears exactly n_bootstrap times overall.
+
+    Past HYPERGEOMETRIC_MAX_POPULATION total draws (200k hands at 5k
+    resamples) it falls back to iid resampling, where balancing no longer
+    changes the interval noticeably.
+    """
+    n_hands = len(hand_results)
+    samples = np.empty(n_bootstrap, dtype=np.float32)
+    balanced = n_hands * n_bootstrap < HYPERGEOMETRIC_MAX_POPULATION
+
+    # Balanced: equivalent to permuting n_bootstrap stacked copies of the
+    # data and cutting it into rows, but drawn tile by tile to bound memory:
+    # each tile takes its share of the remaining copies, then shuffles them
+    remaining = np.full(n_hands, n_bootstrap, dtype=np.int64)
+    hand_idx = np.arange(n_hands, dtype=np.int32)
+    tile = max(1, BOOTSTRAP_TILE_DRAWS // n_hands)
+
+    for start in range(0, n_bootstrap, tile):
+        rows = min(tile, n_bootstrap - start)
+        if balanced:
+            counts = _RNG.multivariate_hypergeometric(remaining, rows * n_hands)
+            remaining -= counts
+
+            pool = np.repeat(hand_idx, counts)
+            _RNG.shuffle(pool)
+            idx = pool.reshape(rows, n_hands)
+        else:
+            idx = _RNG.integers(0, n_hands, size=(rows, n_hands), dtype=np.int32)
+
+        if HAS_NUMBA:
+            # Compiled gather + mean across all cores
+            samples[start:start + rows] = _row_means(hand_results, idx)
+        else:
+            samples[start:start + rows] = (
+                hand_results[idx].sum(axis=1, dtype=np.float64) * (100.0 / n_hands)
+            )
+
+    return samples
+
+
+def _gpu_bootstrap(hand_results: np.ndarray, n_bootstrap: int) -> Optional[np.ndarray]:
+    """Ordinary (iid, not balanced) resample + mean on the GPU. None if CuPy isn't usable."""
+    try:
+        import cupy as cp
+        data = cp.asarray(hand_results)
+    except Exception:
+        return None
+
+    n_hands = len(hand_results)
+    rng = cp.random.default_rng()
+    samples = cp.empty(n_bootstrap, dtype=cp.float32)
+
+    # Batch rows so the index matrix fits comfortably in device memory
+    rows_per_batch = max(1, GPU_BATCH_DRAWS // n_hands)
+    for start in range(0, n_bootstrap, rows_per_batch):
+        rows = min(rows_per_batch, n_bootstrap - start)
+        idx = rng.integers(0, n_hands, size=(rows, n_hands), dtype=cp.int32)
+        samples[start:start + rows] = data[idx].mean(axis=1) * 100
+
+    return samples.get()
+
+
+@st.cache_data(show_spinner=False)
+def _bootstrap_samples(hand_results: np.ndarray, n_bootstrap: int, device: str) -> np.ndarray:
+    """BB/100 of each bootstrap resample, via the fastest available backend.
+
+    CPU resamples are balanced (iid past 1e9 draws); the CUDA path is always iid.
+    """
+    if device == 'cuda' and n_bootstrap * len(hand_results) >= GPU_MIN_DRAWS:
+        samples = _gpu_bootstrap(hand_results, n_bootstrap)
+        if samples is not None:
+            return samples
+
+    return _cpu_bootstrap(hand_results, n_bootstrap)
+
 
 class WinrateEstimator:
     """Bootstrap winrate CI."""
@@ -14,13 +129,18 @@ class WinrateEstimator:
     def __init__(
         self,
         hand_results: list[float],
-        n_bootstrap: int = 10000,
+        n_bootstrap: int = 5000,
         confidence: float = 0.95,
+        device: str = 'cpu',
     ):
-        """Needs 100+ hands."""
-        self.hand_results = np.array(hand_results)
+        """Needs 100+ hands. device='cuda' opts into CuPy (iid resampling) for big runs."""
+        # float32 is plenty for per-hand BB results and halves memory traffic
+        self.hand_results = np.asarray(hand_results, dtype=np.float32)
         self.n_bootstrap = n_bootstrap
         self.confidence = confidence
+        self.device = device
+        # One pass for the total; the point estimate reuses it
+        self._total = float(self.hand_results.sum(dtype=np.float64))
 
         self.point_estimate = None
         self.hdi_lower = None
@@ -32,31 +152,28 @@ class WinrateEstimator:
             self._run_bootstrap()
 
     def _run_bootstrap(self):
-        """10k bootstrap samples -> posterior distribution."""
-        n_hands = len(self.hand_results)
-
+        """5k bootstrap samples -> posterior distribution (see _bootstrap_samples for the scheme)."""
         # Calculate observed winrate (BB/100)
-        self.point_estimate = np.mean(self.hand_results) * 100
-
-        # Bootstrap resampling
-        bootstrap_winrates = []
+        self.point_estimate = self._total / len(self.hand_results) * 100
 
-        for _ in range(self.n_bootstrap):
-            # Sample with replacement
-            sample = np.random.choice(self.hand_results, size=n_hands, replace=True)
-            # Calculate BB/100 for this sample
-            winrate = np.mean(sample) * 100
-            bootstrap_winrates.append(winrate)
+        # Cached across reruns while the hand history is unchanged
+        self.samples = _bootstrap_samples(self.hand_results, self.n_bootstrap, self.device)
 
-        self.samples = np.array(bootstrap_winrates)
+        # Sort once, then read the interval and P(profitable) straight off it
+        sorted_samples = np.sort(self.samples)
 
-        # Calculate HDI (High Density Interval)
-        alpha = 1 - self.confidence
-        self.hdi_lower = np.percentile(self.samples, alpha / 2 * 100)
-        self.hdi_upper = np.percentile(self.samples, (1 - alpha / 2) * 100)
+        # Calculate HDI (High Density Interval) - the narrowest window
+        # holding `confidence` of the samples, not the equal-tailed one
+        n = len(sorted_samples)
+        k = max(1, int(np.ceil(self.confidence * n)))
+        widths = sorted_samples[k - 1:] - sorted_samples[:n - k + 1]
+        i = int(np.argmin(widths))
+        self.hdi_lower = sorted_samples[i]
+        self.hdi_upper = sorted_samples[i + k - 1]
 
-        # Calculate probability of profitability
-        self.prob_profitable = np.mean(self.samples > 0)
+        # Calculate probability of profitability (share of samples above 0)
+        n_not_profitable = np.searchsorted(sorted_samples, 0.0, side='right')
+        self.prob_profitable = 1.0 - n_not_profitable / self.n_bootstrap
 
     def get_summary(self) -> dict:
         """Point estimate, HDI, P(profitable)."""
@@ -71,10 +188,10 @@ class WinrateEstimator:
             }
 
         return {
-            'point_estimate': round(self.point_estimate, 2),
-            'hdi_lower': round(self.hdi_lower, 2),
-            'hdi_upper': round(self.hdi_upper, 2),
-            'prob_profitable': round(self.prob_profitable * 100, 1),
+            'point_estimate': round(float(self.point_estimate), 2),
+            'hdi_lower': round(float(self.hdi_lower), 2),
+            'hdi_upper': round(float(self.hdi_upper), 2),
+            'prob_profitable': round(float(self.prob_profitable) * 100, 1),
             'sample_size': len(self.hand_results),
             'status': 'Complete',
         }
@@ -107,48 +224,43 @@ class WinrateEstimator:
         return f"{verdict} {size_note}"
 
 
-def render_posterior_chart(
-    hand_results: list[float],
-    title: str = "Posterior Winrate Distribution (Bootstrap)",
-) -> Optional[WinrateEstimator]:
-    """Histogram of bootstrap winrate samples."""
-    if len(hand_results) < 100:
-        st.warning("Need at least 100 hands for Bayesian estimation.")
-        return None
-
-    # Fit model
-    model = WinrateEstimator(hand_results)
-
-    if model.samples is None:
-        st.error("Failed to run bootstrap estimation.")
-        return None
-
+@st.cache_data(show_spinner=False)
+def _posterior_figure(
+    samples: np.ndarray,
+    hdi_lower: float,
+    hdi_upper: float,
+    point_estimate: float,
+    title: str,
+) -> dict:
+    """Posterior histogram figure as a dict, cached across reruns."""
     # Create figure
     fig = go.Figure()
 
-    # Add histogram
-    fig.add_trace(go.Histogram(
-        x=model.samples,
-        nbinsx=50,
+    # Add histogram (binned here so only 50 bars go to the browser)
+    counts, edges = np.histogram(samples, bins=50)
+    fig.add_trace(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges) * 0.9,
         name='Posterior Distribution',
         marker_color='rgba(52, 152, 219, 0.7)',
         hovertemplate='BB/100: %{x:.2f}<br>Count: %{y}<extra></extra>',
     ))
 
-    # Add vertical lines for CI bounds
+    # Add vertical lines for HDI bounds
     fig.add_vline(
-        x=model.hdi_lower,
+        x=hdi_lower,
         line_dash='dash',
         line_color='#E74C3C',
-        annotation_text=f'2.5%: {model.hdi_lower:.2f}',
+        annotation_text=f'HDI low: {hdi_lower:.2f}',
         annotation_position='top left',
     )
 
     fig.add_vline(
-        x=model.hdi_upper,
+        x=hdi_upper,
         line_dash='dash',
         line_color='#E74C3C',
-        annotation_text=f'97.5%: {model.hdi_upper:.2f}',
+        annotation_text=f'HDI high: {hdi_upper:.2f}',
         annotation_position='top right',
     )
 
@@ -164,17 +276,17 @@ def render_posterior_chart(
 
     # Add point estimate line
     fig.add_vline(
-        x=model.point_estimate,
+        x=point_estimate,
         line_dash='dot',
         line_color='#27AE60',
-        annotation_text=f'Observed: {model.point_estimate:.2f}',
+        annotation_text=f'Observed: {point_estimate:.2f}',
         annotation_position='top',
     )
 
     # Shade the 95% HDI region
     fig.add_vrect(
-        x0=model.hdi_lower,
-        x1=model.hdi_upper,
+        x0=hdi_lower,
+        x1=hdi_upper,
         fillcolor='rgba(231, 76, 60, 0.1)',
         line_width=0,
     )
@@ -190,9 +302,31 @@ def render_posterior_chart(
         height=400,
         margin=dict(l=20, r=20, t=50, b=20),
         showlegend=False,
-        bargap=0.1,
     )
 
+    return fig.to_dict()
+
+
+def render_posterior_chart(
+    hand_results: list[float],
+    title: str = "Posterior Winrate Distribution (Bootstrap)",
+) -> Optional[WinrateEstimator]:
+    """Histogram of bootstrap winrate samples."""
+    if len(hand_results) < 100:
+        st.warning("Need at least 100 hands for Bayesian estimation.")
+        return None
+
+    # Fit model
+    model = WinrateEstimator(hand_results)
+
+    if model.samples is None:
+        st.error("Failed to run bootstrap estimation.")
+        return None
+
+    # Figure dict is cached; only rebuilt when the fit changes
+    fig = go.Figure(_posterior_figure(
+        model.samples, model.hdi_lower, model.hdi_upper, model.point_estimate, title,
+    ))
     st.plotly_chart(fig, use_container_width=True)
 
     return model
@@ -6,8 +6,7 @@ import plotly.graph_objects as go
 import streamlit as st
 from typing import Optional
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 
 
 # Archetype definitions based on centroid characteristics
@@ -39,6 +38,42 @@ ARCHETYPES = {
     },
 }
 
+# Above this many players, switch to mini-batch K-means
+MINIBATCH_THRESHOLD = 500
+
+
+@st.cache_data(show_spinner=False)
+def _fit_clusters(X: np.ndarray, n_clusters: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Standardize, project to 2 PCs, and K-means. Returns (scaled, pcs, labels)."""
+    # Standardize features
+    scaled = StandardScaler().fit_transform(X)
+
+    # PCA to 2 components via eigendecomposition of the small d x d
+    # covariance (features are already centered by the scaler)
+    cov = np.cov(scaled, rowvar=False)
+    eigvals, eigvecs = np.linalg.eigh(cov)
+    components = eigvecs[:, np.argsort(-eigvals)[:2]]
+    pca_result = scaled @ components
+
+    # K-Means clustering (Elkan is cheap on 4 features; mini-batch for big pools)
+    if len(X) < MINIBATCH_THRESHOLD:
+        kmeans = KMeans(
+            n_clusters=n_clusters,
+            random_state=42,
+            n_init='auto',
+            algorithm='elkan',
+        )
+    else:
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_clusters,
+            random_state=42,
+            batch_size=256,
+            n_init=3,
+        )
+    labels = kmeans.fit_predict(scaled)
+
+    return scaled, pca_result, labels
+
 
 class VillainCluster:
     """K-means on opponent stats."""
@@ -86,11 +121,9 @@ class VillainCluster:
         # Add WTSD if not present (estimate from other stats)
         if 'wtsd' not in self.filtered_stats.columns:
             # Estimate: higher VPIP + lower AF = higher WTSD
-            self.filtered_stats['wtsd'] = (
-                self.filtered_stats['vpip'] * 0.5
-                - self.filtered_stats['af'] * 5
-                + 30
-            ).clip(10, 60)
+            vpip = self.filtered_stats['vpip'].to_numpy(dtype=float)
+            af = self.filtered_stats['af'].to_numpy(dtype=float)
+            self.filtered_stats['wtsd'] = np.clip(vpip * 0.5 - af * 5.0 + 30.0, 10.0, 60.0)
 
     def _fit_model(self) -> None:
         """Fit PCA and K-Means to the data."""
@@ -103,13 +136,8 @@ class VillainCluster:
 
         X = self.filtered_stats[available_cols].fillna(0).values
 
-        # Standardize features
-        scaler = StandardScaler()
-        self.scaled_features = scaler.fit_transform(X)
-
-        # PCA to 2 components
-        pca = PCA(n_components=2)
-        pca_result = pca.fit_transform(self.scaled_features)
+        # Fit is cached across reruns while the stats are unchanged
+        self.scaled_features, pca_result, self.labels = _fit_clusters(X, self.n_clusters)
 
         self.pca_coords = pd.DataFrame(
             pca_result,
@@ -117,10 +145,6 @@ class VillainCluster:
             index=self.filtered_stats.index,
         )
         self.pca_coords['name'] = self.filtered_stats['name'].values
-
-        # K-Means clustering
-        kmeans = KMeans(n_clusters=self.n_clusters, random_state=42, n_init=10)
-        self.labels = kmeans.fit_predict(self.scaled_features)
         self.pca_coords['cluster'] = self.labels
 
         # Copy stats to pca_coords for hover
@@ -147,34 +171,32 @@ class VillainCluster:
         self.cluster_stats = pd.DataFrame(cluster_data)
 
         # Assign archetype names based on centroid characteristics
+        # (missing stats fall back to typical values)
+        n = len(self.cluster_stats)
+        vpip, pfr, af = (
+            self.cluster_stats[col].to_numpy() if col in self.cluster_stats else np.full(n, default)
+            for col, default in (('vpip', 25.0), ('pfr', 15.0), ('af', 2.0))
+        )
+
+        # Classification logic (first matching rule wins)
+        conditions = [
+            (vpip < 20) & (pfr < 15),
+            (vpip < 28) & (pfr > 15) & (af > 2),
+            (vpip > 35) & (af > 4),
+            (vpip > 35) & (af > 3),
+            (vpip > 35) & (af < 2),
+        ]
+        choices = ['Nit', 'TAG', 'Maniac', 'LAG', 'Calling Station']
+        names = np.select(conditions, choices, default='TAG').tolist()
+
+        # Avoid duplicates: in cluster order, a repeat takes the first unused alternative
         self.cluster_names = {}
         used_names = set()
+        alternatives = ['LAG', 'Calling Station', 'Maniac', 'Nit', 'TAG']
 
-        for _, row in self.cluster_stats.iterrows():
-            cluster_id = int(row['cluster'])
-            vpip = row.get('vpip', 25)
-            pfr = row.get('pfr', 15)
-            af = row.get('af', 2)
-
-            # Classification logic
-            if vpip < 20 and pfr < 15:
-                name = 'Nit'
-            elif vpip < 28 and pfr > 15 and af > 2:
-                name = 'TAG'
-            elif vpip > 35 and af > 3:
-                name = 'Maniac' if af > 4 else 'LAG'
-            elif vpip > 35 and af < 2:
-                name = 'Calling Station'
-            else:
-                name = 'TAG'
-
-            # Avoid duplicates
+        for cluster_id, name in zip(self.cluster_stats['cluster'].tolist(), names):
             if name in used_names:
-                alternatives = ['LAG', 'Calling Station', 'Maniac', 'Nit', 'TAG']
-                for alt in alternatives:
-                    if alt not in used_names:
-                        name = alt
-                        break
+                name = next((alt for alt in alternatives if alt not in used_names), name)
 
             self.cluster_names[cluster_id] = name
             used_names.add(name)
@@ -200,53 +222,30 @@ class VillainCluster:
         return None
 
 
-def render_cluster_chart(
-    player_stats: pd.DataFrame,
-    title: str = "Villain Population Analysis (PCA + K-Means)",
-) -> Optional[VillainCluster]:
-    """
-    Render the PCA/K-Means cluster visualization.
-
-    Args:
-        player_stats: DataFrame with player statistics.
-        title: Chart title.
-
-    Returns:
-        VillainCluster instance or None if insufficient data.
-    """
-    if player_stats is None or len(player_stats) < 4:
-        st.warning("Need at least 4 opponents with 50+ hands for clustering.")
-        return None
-
-    # Fit model
-    model = VillainCluster(player_stats)
-
-    if model.pca_coords is None or len(model.pca_coords) < 4:
-        st.warning("Insufficient data after filtering. Need more opponents with 50+ hands.")
-        return None
-
+@st.cache_data(show_spinner=False)
+def _cluster_figure(
+    pca_coords: pd.DataFrame,
+    title: str,
+) -> dict:
+    """Cluster scatter figure as a dict, cached across reruns."""
     # Create figure
     fig = go.Figure()
 
     # Add scatter points by cluster
     for archetype, info in ARCHETYPES.items():
-        mask = model.pca_coords['archetype'] == archetype
+        mask = pca_coords['archetype'] == archetype
         if not mask.any():
             continue
 
-        subset = model.pca_coords[mask]
+        subset = pca_coords[mask]
 
-        # Build hover text
-        hover_text = []
-        for _, row in subset.iterrows():
-            text = (
-                f"<b>{row['name']}</b><br>"
-                f"VPIP: {row.get('vpip', 0):.1f}%<br>"
-                f"PFR: {row.get('pfr', 0):.1f}%<br>"
-                f"AF: {row.get('af', 0):.2f}<br>"
-                f"Archetype: {archetype}"
-            )
-            hover_text.append(text)
+        # Raw stats go to the client; hovertemplate formats them there
+        customdata = np.column_stack([
+            subset['name'].to_numpy(dtype=object),
+            subset['vpip'].to_numpy(),
+            subset['pfr'].to_numpy(),
+            subset['af'].to_numpy(),
+        ])
 
         fig.add_trace(go.Scatter(
             x=subset['PC1'],
@@ -261,8 +260,15 @@ def render_cluster_chart(
             text=subset['name'],
             textposition='top center',
             textfont=dict(size=9, color='#888'),
-            hovertemplate='%{customdata}<extra></extra>',
-            customdata=hover_text,
+            hovertemplate=(
+                '<b>%{customdata[0]}</b><br>'
+                'VPIP: %{customdata[1]:.1f}%<br>'
+                'PFR: %{customdata[2]:.1f}%<br>'
+                'AF: %{customdata[3]:.2f}<br>'
+                f'Archetype: {archetype}'
+                '<extra></extra>'
+            ),
+            customdata=customdata,
         ))
 
     # Style
@@ -290,6 +296,36 @@ def render_cluster_chart(
     fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(255,255,255,0.1)')
     fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(255,255,255,0.1)')
 
+    return fig.to_dict()
+
+
+def render_cluster_chart(
+    player_stats: pd.DataFrame,
+    title: str = "Villain Population Analysis (PCA + K-Means)",
+) -> Optional[VillainCluster]:
+    """
+    Render the PCA/K-Means cluster visualization.
+
+    Args:
+        player_stats: DataFrame with player statistics.
+        title: Chart title.
+
+    Returns:
+        VillainCluster instance or None if insufficient data.
+    """
+    if player_stats is None or len(player_stats) < 4:
+        st.warning("Need at least 4 opponents with 50+ hands for clustering.")
+        return None
+
+    # Fit model
+    model = VillainCluster(player_stats)
+
+    if model.pca_coords is None or len(model.pca_coords) < 4:
+        st.warning("Insufficient data after filtering. Need more opponents with 50+ hands.")
+        return None
+
+    # Figure dict is cached; only rebuilt when the fit changes
+    fig = go.Figure(_cluster_figure(model.pca_coords, title))
     st.plotly_chart(fig, use_container_width=True)
 
     return model
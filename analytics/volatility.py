@@ -2,49 +2,62 @@
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 import plotly.graph_objects as go
 import streamlit as st
 from typing import Optional
 from arch import arch_model
 
 
+@st.cache_data(show_spinner=False)
+def _fit_garch(returns: np.ndarray) -> tuple[np.ndarray, float]:
+    """GARCH(1,1) conditional volatility on scaled returns, plus the scale."""
+    # Scale returns for numerical stability
+    std = float(np.std(returns))
+    scale_factor = std if std > 0 else 1.0
+    scaled_returns = returns / scale_factor * 100
+
+    # Fit GARCH(1,1) model
+    model = arch_model(
+        scaled_returns,
+        vol='Garch',
+        p=1,
+        q=1,
+        mean='Constant',
+        rescale=False,
+    )
+
+    results = model.fit(disp='off', show_warning=False)
+    return np.asarray(results.conditional_volatility), scale_factor
+
+
 class VolatilityModel:
     """GARCH volatility model."""
 
     def __init__(self, pnl_series: pd.Series):
         """Needs 10+ sessions to fit."""
         self.pnl_series = pnl_series.dropna()
-        self.model = None
-        self.results = None
         self.conditional_volatility = None
         self.current_regime = None
         self.regime_thresholds = None
+        self._sorted_cv = None
 
         if len(self.pnl_series) >= 10:
             self._fit_model()
 
+        # Sorted once so percentile lookups are a binary search
+        if self.conditional_volatility is not None:
+            self._sorted_cv = np.sort(self.conditional_volatility.to_numpy())
+
     def _fit_model(self) -> None:
         """Fit the GARCH(1,1) model to the PnL series."""
         try:
-            # Scale returns for numerical stability
-            returns = self.pnl_series.values
-            scale_factor = np.std(returns) if np.std(returns) > 0 else 1
-            scaled_returns = returns / scale_factor * 100
-
-            # Fit GARCH(1,1) model
-            self.model = arch_model(
-                scaled_returns,
-                vol='Garch',
-                p=1,
-                q=1,
-                mean='Constant',
-                rescale=False,
+            # Fit is cached across reruns while the PnL series is unchanged
+            cond_vol, scale_factor = _fit_garch(
+                np.ascontiguousarray(self.pnl_series.to_numpy(dtype=np.float64))
             )
 
-            self.results = self.model.fit(disp='off', show_warning=False)
-
-            # Get conditional volatility and rescale
-            cond_vol = self.results.conditional_volatility
+            # Rescale conditional volatility back to dollars
             self.conditional_volatility = pd.Series(
                 cond_vol * scale_factor / 100,
                 index=self.pnl_series.index,
@@ -71,11 +84,19 @@ class VolatilityModel:
 
     def _fallback_volatility(self) -> None:
         """Use rolling standard deviation as fallback."""
-        window = min(10, len(self.pnl_series))
-        self.conditional_volatility = self.pnl_series.rolling(
-            window=window,
-            min_periods=3,
-        ).std().fillna(method='bfill')
+        values = self.pnl_series.to_numpy(dtype=float)
+        window = min(10, len(values))
+        min_periods = 3
+
+        # Rolling std (ddof=1) over full windows in one strided pass
+        rolling = np.full(len(values), np.nan)
+        rolling[window - 1:] = sliding_window_view(values, window).std(axis=1, ddof=1)
+
+        # Leading partial windows, once at least min_periods points exist
+        for i in range(min_periods - 1, window - 1):
+            rolling[i] = values[:i + 1].std(ddof=1)
+
+        self.conditional_volatility = pd.Series(rolling, index=self.pnl_series.index).bfill()
 
         vol_mean = self.conditional_volatility.mean()
         vol_std = self.conditional_volatility.std()
@@ -126,10 +147,8 @@ class VolatilityModel:
             }
 
         current_vol = self.conditional_volatility.iloc[-1]
-        percentile = (
-            (self.conditional_volatility < current_vol).sum()
-            / len(self.conditional_volatility) * 100
-        )
+        n_below = np.searchsorted(self._sorted_cv, current_vol, side='left')
+        percentile = n_below / len(self._sorted_cv) * 100
 
         return {
             'current_regime': self.current_regime,
@@ -139,38 +158,20 @@ class VolatilityModel:
         }
 
 
-def render_volatility_chart(
-    pnl_series: pd.Series,
-    title: str = "Conditional Volatility (GARCH)",
-) -> Optional[VolatilityModel]:
-    """
-    Render the GARCH volatility chart with regime bands.
-
-    Args:
-        pnl_series: pandas Series of session PnL values.
-        title: Chart title.
-
-    Returns:
-        VolatilityModel instance or None if insufficient data.
-    """
-    if len(pnl_series) < 10:
-        st.warning("Need at least 10 sessions for volatility modeling.")
-        return None
-
-    # Fit model
-    model = VolatilityModel(pnl_series)
-
-    if model.conditional_volatility is None:
-        st.error("Failed to fit volatility model.")
-        return None
-
+@st.cache_data(show_spinner=False)
+def _volatility_figure(
+    conditional_volatility: pd.Series,
+    regime_thresholds: dict,
+    title: str,
+) -> dict:
+    """Volatility chart figure as a dict, cached across reruns."""
     # Create figure
     fig = go.Figure()
 
     # Add conditional volatility line
     fig.add_trace(go.Scatter(
-        x=model.conditional_volatility.index,
-        y=model.conditional_volatility.values,
+        x=conditional_volatility.index,
+        y=conditional_volatility.values,
         mode='lines',
         name='Conditional Volatility',
         line=dict(color='#3498DB', width=2),
@@ -178,7 +179,7 @@ def render_volatility_chart(
     ))
 
     # Add mean line
-    mean_vol = model.regime_thresholds['mean']
+    mean_vol = regime_thresholds['mean']
     fig.add_hline(
         y=mean_vol,
         line_dash='dash',
@@ -187,7 +188,7 @@ def render_volatility_chart(
     )
 
     # Add +2σ band (High volatility zone)
-    high_threshold = mean_vol + 2 * model.regime_thresholds['std']
+    high_threshold = mean_vol + 2 * regime_thresholds['std']
     fig.add_hline(
         y=high_threshold,
         line_dash='dot',
@@ -196,7 +197,7 @@ def render_volatility_chart(
     )
 
     # Add -2σ band (Low volatility zone)
-    low_threshold = max(0, mean_vol - 2 * model.regime_thresholds['std'])
+    low_threshold = max(0, mean_vol - 2 * regime_thresholds['std'])
     fig.add_hline(
         y=low_threshold,
         line_dash='dot',
@@ -206,7 +207,7 @@ def render_volatility_chart(
 
     # Add regime shading
     fig.add_hrect(
-        y0=model.regime_thresholds['high_lower'],
+        y0=regime_thresholds['high_lower'],
         y1=high_threshold,
         fillcolor='rgba(231, 76, 60, 0.1)',
         line_width=0,
@@ -216,7 +217,7 @@ def render_volatility_chart(
 
     fig.add_hrect(
         y0=low_threshold,
-        y1=model.regime_thresholds['low_upper'],
+        y1=regime_thresholds['low_upper'],
         fillcolor='rgba(39, 174, 96, 0.1)',
         line_width=0,
         annotation_text='Low Vol',
@@ -243,6 +244,38 @@ def render_volatility_chart(
         ),
     )
 
+    return fig.to_dict()
+
+
+def render_volatility_chart(
+    pnl_series: pd.Series,
+    title: str = "Conditional Volatility (GARCH)",
+) -> Optional[VolatilityModel]:
+    """
+    Render the GARCH volatility chart with regime bands.
+
+    Args:
+        pnl_series: pandas Series of session PnL values.
+        title: Chart title.
+
+    Returns:
+        VolatilityModel instance or None if insufficient data.
+    """
+    if len(pnl_series) < 10:
+        st.warning("Need at least 10 sessions for volatility modeling.")
+        return None
+
+    # Fit model
+    model = VolatilityModel(pnl_series)
+
+    if model.conditional_volatility is None:
+        st.error("Failed to fit volatility model.")
+        return None
+
+    # Figure dict is cached; only rebuilt when the fit changes
+    fig = go.Figure(_volatility_figure(
+        model.conditional_volatility, model.regime_thresholds, title,
+    ))
     st.plotly_chart(fig, use_container_width=True)
 
     return model
@@ -1,5 +1,9 @@
 """Main streamlit app."""
 
+import heapq
+import io
+from datetime import datetime
+
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -7,10 +11,10 @@ import plotly.graph_objects as go
 from utils.data_loader import (
     load_sessions,
     save_session,
-    get_session,
     update_session,
     delete_session,
     save_hand,
+    save_hands,
     load_hands,
     get_existing_hand_ids,
     load_opponents,
@@ -21,16 +25,12 @@ from utils.data_loader import (
     calculate_opponent_stats,
     load_settings,
     update_bankroll,
+    SESSIONS_FILE,
+    DUMMY_SESSIONS_FILE,
+    HANDS_FILE,
+    OPPONENTS_FILE,
 )
-from utils.analytics_engine import get_edge_summary, analyze_opponent_tendencies
-from utils.ai_coach import (
-    analyze_hand,
-    render_api_key_input,
-    render_analysis_result,
-    get_api_key,
-)
-from utils.ignition_parser import parse_ignition_file, get_import_summary
-from utils.range_analyzer import analyze_ranges, get_range_grid_data, get_position_summary, RANKS
+from utils.analytics_engine import get_edge_summary
 from utils.poker_math import calculate_winrate_ci, get_sample_size_message
 from utils.monte_carlo import (
     simulate_bankroll,
@@ -52,6 +52,8 @@ from components import (
     render_board_cards,
     render_analytics_page,
     parse_multi_cards,
+    reset_card_selectors,
+    SUIT_COLORS,
     render_hand_visualizer,
     render_hand_replayer,
 )
@@ -66,6 +68,258 @@ st.set_page_config(
 )
 
 
+# =============================================================================
+# HTML Templates
+# =============================================================================
+
+LIVE_SESSION_TMPL = (
+    '<div style="background: linear-gradient(135deg, #27AE60, #2ECC71); '
+    'padding: 10px; border-radius: 8px; margin: 10px 0;">'
+    '<span style="color: white; font-weight: bold;">🟢 LIVE SESSION</span><br>'
+    '<span style="color: #E8F8F5; font-size: 0.9em;">'
+    '{location} - ${stake}</span>'
+    '</div>'
+)
+
+EXPLOIT_CARD_TMPL = (
+    '<div style="background: linear-gradient(135deg, #27AE60, #2ECC71); '
+    'padding: 10px; border-radius: 8px; margin: 5px 0;">'
+    '<span style="color: white; font-weight: bold;">'
+    '+{bb_100:.1f} BB/100</span> '
+    '<span style="color: #E8F8F5;">{description}</span>'
+    '<br><span style="color: #A9DFBF; font-size: 0.8em;">'
+    '${total_profit:+,.0f} over {hands} hands</span>'
+    '</div>'
+)
+
+LEAK_CARD_TMPL = (
+    '<div style="background: linear-gradient(135deg, #E74C3C, #C0392B); '
+    'padding: 10px; border-radius: 8px; margin: 5px 0;">'
+    '<span style="color: white; font-weight: bold;">'
+    '{bb_100:.1f} BB/100</span> '
+    '<span style="color: #FADBD8;">{description}</span>'
+    '<br><span style="color: #F5B7B1; font-size: 0.8em;">'
+    '${total_loss:+,.0f} over {hands} hands</span>'
+    '</div>'
+)
+
+# Dark mode stylesheet injected by apply_theme()
+DARK_THEME_STYLE = "<style>.stApp { background-color: #0e1117; }</style>"
+
+# Recommendation priority -> marker
+PRIORITY_ICONS = {"HIGH": "🔴", "MEDIUM": "🟡", "LOW": "🟢"}
+
+
+# =============================================================================
+# Cached Data Loaders
+# =============================================================================
+# Keyed on data-file mtimes so reruns skip JSON parsing until a file changes.
+
+def _file_mtime(path) -> int:
+    """mtime (ns) for cache keys; 0 if the file doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _sessions_key() -> tuple[int, int]:
+    """Cache key covering the real and dummy sessions files."""
+    return _file_mtime(SESSIONS_FILE), _file_mtime(DUMMY_SESSIONS_FILE)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_sessions(key: tuple[int, int]) -> list[dict]:
+    """load_sessions(), reparsed only when the sessions files change."""
+    return load_sessions()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_session(key: tuple[int, int], session_id: int) -> dict | None:
+    """get_session() from the cached list, looked up once per sessions-file change."""
+    return next((s for s in _cached_sessions(key) if s.get("id") == session_id), None)
+
+
+SESSION_COLUMNS = [
+    "date", "location", "stake", "buy_in", "cash_out", "profit",
+    "duration_hours", "status", "id", "notes",
+]
+SESSION_NUMERIC_COLUMNS = ["buy_in", "cash_out", "profit", "duration_hours"]
+# Displayed text columns, held as Arrow strings so st.dataframe ships them as-is
+SESSION_TEXT_COLUMNS = ["date", "location", "stake"]
+
+# Recent Sessions table: labels/formats applied in the browser, no renamed copy
+SESSION_TABLE_CONFIG = {
+    "date": st.column_config.TextColumn("Date"),
+    "location": st.column_config.TextColumn("Location"),
+    "stake": st.column_config.TextColumn("Stake"),
+    "buy_in": st.column_config.NumberColumn("Buy-in", format="$%.2f"),
+    "cash_out": st.column_config.NumberColumn("Cash-out", format="$%.2f"),
+    "profit": st.column_config.NumberColumn("Profit", format="$%.2f"),
+    "duration_hours": st.column_config.NumberColumn("Hours", format="%.1f"),
+}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_dashboard_data(key: tuple[int, int]) -> tuple[pd.DataFrame, dict]:
+    """(sessions df, KPIs), rebuilt only when sessions change."""
+    # Built from the same cached parse the rest of the dashboard uses
+    df = pd.DataFrame(_cached_sessions(key), columns=SESSION_COLUMNS)
+    # Newest first, sorted once here rather than on every render
+    df = df.sort_values("date", ascending=False, kind="stable", ignore_index=True)
+
+    # JSON gives object columns (ints, floats, missing fields); coerce once
+    numeric = df[SESSION_NUMERIC_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    # Live sessions have no cash-out yet, so there's no profit to derive
+    cashed_out = numeric["cash_out"].notna().to_numpy()
+    df[SESSION_NUMERIC_COLUMNS] = numeric.fillna(0.0)
+    df[SESSION_TEXT_COLUMNS] = df[SESSION_TEXT_COLUMNS].astype("string[pyarrow]")
+
+    # For manual sessions, calculate profit from buy_in/cash_out
+    # For imported sessions, profit is already calculated from hand results
+    # Only overwrite if profit field is missing or zero and we have buy_in/cash_out data
+    buy_in = df["buy_in"].to_numpy(dtype=float)
+    cash_out = df["cash_out"].to_numpy(dtype=float)
+    hours = df["duration_hours"].to_numpy(dtype=float)
+    profit = df["profit"].to_numpy(dtype=float)
+    profit = np.where((profit == 0) & (buy_in != 0) & cashed_out, cash_out - buy_in, profit)
+    df["profit"] = profit
+
+    total_profit = float(profit.sum())
+    total_hours = float(hours.sum())
+    avg_hourly = total_profit / total_hours if total_hours > 0 else 0
+
+    # Show profit with color indicator
+    profit_indicator = "🟢" if total_profit > 0 else "🔴" if total_profit < 0 else "⚪"
+    profit_sign = "+" if total_profit > 0 else ""
+    kpis = {
+        "total_profit": total_profit,
+        "total_hours": total_hours,
+        "avg_hourly": avg_hourly,
+        "count": len(df),
+        # (label, value) pairs for the KPI row, formatted once per data change
+        "metrics": [
+            ("Total P&L", f"{profit_indicator} {profit_sign}${total_profit:.2f}"),
+            ("Sessions", len(df)),
+            ("Hours Played", f"{total_hours:.1f}"),
+            ("Avg $/hr", f"${avg_hourly:.2f}"),
+        ],
+    }
+
+    return df, kpis
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_session_options(key: tuple[int, int]) -> dict[str, int]:
+    """Manage Sessions selectbox labels -> session id, newest first."""
+    df, _ = _cached_dashboard_data(key)
+    completed = df[df["status"] != "active"]
+    if completed.empty:
+        return {}
+
+    labels = (
+        completed["date"].astype(str) + " - " + completed["location"].astype(str)
+        + " (" + completed["stake"].astype(str) + ") - $"
+        + completed["profit"].map("{:+,.2f}".format)
+    )
+    return dict(zip(labels, completed["id"].tolist()))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_import_history(key: tuple[int, int], limit: int = 5) -> list[dict]:
+    """Most recent imported sessions, newest first."""
+    imported = (s for s in _cached_sessions(key) if s.get("source") == "ignition_import")
+    return heapq.nlargest(limit, imported, key=lambda s: s.get("date", ""))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_hands(mtime: int) -> list[dict]:
+    """load_hands(), reparsed only when the hands file changes."""
+    return load_hands()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_recent_hands(mtime: int, session_id: int, limit: int = 5) -> tuple[int, list[dict]]:
+    """(hand count, last `limit` hands newest first) for one session."""
+    hands = [h for h in _cached_hands(mtime) if h.get("session_id") == session_id]
+    return len(hands), hands[-limit:][::-1]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_range_data(mtime: int, position_filter: str | None) -> dict:
+    """analyze_ranges() for one position filter, rebuilt only when hands change."""
+    from utils.range_analyzer import analyze_ranges
+
+    return analyze_ranges(_cached_hands(mtime), position_filter)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_position_summary(mtime: int) -> dict:
+    """get_position_summary(), rebuilt only when hands change."""
+    from utils.range_analyzer import get_position_summary
+
+    return get_position_summary(_cached_hands(mtime))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_opponents(mtime: int) -> list[dict]:
+    """load_opponents(), reparsed only when the opponents file changes."""
+    return load_opponents()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_opponent_names(mtime: int) -> tuple[str, ...]:
+    """Villain selectbox options, rebuilt only when the opponents file changes."""
+    return ("(None)",) + tuple(o.get("name", "") for o in _cached_opponents(mtime))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_edge_summary(hands_mtime: int, sessions_key: tuple[int, int]) -> dict:
+    """get_edge_summary(), recomputed only when hands or sessions change."""
+    return get_edge_summary(_cached_hands(hands_mtime), _cached_sessions(sessions_key))
+
+
+def clear_sessions_cache():
+    """Drop cached sessions after a write."""
+    _cached_sessions.clear()
+    _cached_session.clear()
+    _cached_dashboard_data.clear()
+    _cached_session_options.clear()
+    _cached_import_history.clear()
+    _cached_edge_summary.clear()
+
+
+def clear_opponents_cache():
+    """Drop cached opponents after a write."""
+    _cached_opponents.clear()
+    _cached_opponent_names.clear()
+
+
+def clear_hands_cache():
+    """Drop cached hands after a write."""
+    _cached_hands.clear()
+    _cached_recent_hands.clear()
+    _cached_range_data.clear()
+    _cached_position_summary.clear()
+    _cached_range_figure.clear()
+    _cached_edge_summary.clear()
+
+
+def get_active_session() -> dict | None:
+    """The active session's record, looked up again only when the sessions files change."""
+    session_id = st.session_state.active_session_id
+    if session_id is None:
+        return None
+
+    # Memo keyed on the sessions files' mtimes, so any write invalidates it
+    key = (_sessions_key(), session_id)
+    memo = st.session_state.get("_active_session_memo")
+    if memo is None or memo[0] != key:
+        memo = (key, _cached_session(*key))
+        st.session_state["_active_session_memo"] = memo
+    return memo[1]
+
+
 def init_session_state():
     """Init session state."""
     if "dark_mode" not in st.session_state:
@@ -81,15 +335,21 @@ def init_session_state():
 
 def apply_theme():
     """Apply theme."""
+    # Re-emitted every rerun: Streamlit drops elements a run doesn't write
     if st.session_state.dark_mode:
-        st.markdown(
-            """
-            <style>
-            .stApp { background-color: #0e1117; }
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(DARK_THEME_STYLE, unsafe_allow_html=True)
+
+
+def _sync_dark_mode():
+    """Toggle callback: runs before the rerun, so apply_theme() sees the new mode."""
+    st.session_state.dark_mode = st.session_state.dark_mode_toggle
+
+
+def _sync_bankroll():
+    """Bankroll input callback: save before the rerun so the status bar is current."""
+    st.session_state.bankroll = st.session_state.bankroll_input
+    st.session_state.bankroll_target = st.session_state.target_input
+    update_bankroll(st.session_state.bankroll, st.session_state.bankroll_target)
 
 
 def render_sidebar():
@@ -99,15 +359,13 @@ def render_sidebar():
 
         # Live session indicator
         if st.session_state.active_session_id:
-            session = get_session(st.session_state.active_session_id)
+            session = get_active_session()
             if session and session.get("status") == "active":
                 st.markdown(
-                    f'<div style="background: linear-gradient(135deg, #27AE60, #2ECC71); '
-                    f'padding: 10px; border-radius: 8px; margin: 10px 0;">'
-                    f'<span style="color: white; font-weight: bold;">🟢 LIVE SESSION</span><br>'
-                    f'<span style="color: #E8F8F5; font-size: 0.9em;">'
-                    f'{session.get("location")} - ${session.get("stake")}</span>'
-                    f'</div>',
+                    LIVE_SESSION_TMPL.format(
+                        location=session.get("location"),
+                        stake=session.get("stake"),
+                    ),
                     unsafe_allow_html=True,
                 )
             else:
@@ -151,43 +409,38 @@ def render_sidebar():
 
         # Settings
         with st.expander("⚙️ Settings"):
-            dark_mode = st.toggle(
+            st.toggle(
                 "Dark Mode",
                 value=st.session_state.dark_mode,
                 key="dark_mode_toggle",
+                on_change=_sync_dark_mode,
             )
-            if dark_mode != st.session_state.dark_mode:
-                st.session_state.dark_mode = dark_mode
-                st.rerun()
 
             st.markdown("---")
             st.markdown("**Bankroll Settings**")
-            new_bankroll = st.number_input(
+            st.number_input(
                 "Current Bankroll ($)",
                 value=float(st.session_state.bankroll),
                 min_value=0.00,
                 step=0.01,
                 format="%.2f",
                 key="bankroll_input",
+                on_change=_sync_bankroll,
             )
-            new_target = st.number_input(
+            st.number_input(
                 "Target for Next Stake ($)",
                 value=float(st.session_state.bankroll_target),
                 min_value=0.01,
                 step=0.01,
                 format="%.2f",
                 key="target_input",
+                on_change=_sync_bankroll,
             )
-            if new_bankroll != st.session_state.bankroll or new_target != st.session_state.bankroll_target:
-                st.session_state.bankroll = new_bankroll
-                st.session_state.bankroll_target = new_target
-                # Save to persistent file and refresh to sync both displays
-                update_bankroll(new_bankroll, new_target)
-                st.rerun()
 
         st.markdown("---")
 
         # AI Coach Settings
+        from utils.ai_coach import render_api_key_input
         render_api_key_input()
 
         st.caption("v0.6.0 | Phase 4: Polish")
@@ -199,51 +452,26 @@ def render_dashboard():
     """Main dashboard."""
     st.header("📊 Dashboard")
 
-    sessions = load_sessions()
+    sessions_key = _sessions_key()
+    sessions = _cached_sessions(sessions_key)
 
     if not sessions:
         st.info("📭 No Data Yet — Log your first session to get started!")
         return
 
-    df = pd.DataFrame(sessions)
-
-    # Calculate summary stats
-    # For manual sessions, calculate profit from buy_in/cash_out
-    # For imported sessions, profit is already calculated from hand results
-    # Only overwrite if profit field is missing or zero and we have buy_in/cash_out data
-    if (df["profit"] == 0).any() and (df["buy_in"] != 0).any():
-        mask = (df["profit"] == 0) & (df["buy_in"] != 0)
-        df.loc[mask, "profit"] = df.loc[mask, "cash_out"] - df.loc[mask, "buy_in"]
-
-    # Recalculate hourly rate from stored profit
-    df["hourly_rate"] = df["profit"] / df["duration_hours"]
-
-    total_profit = df["profit"].sum()
-    total_hours = df["duration_hours"].sum()
-    avg_hourly = total_profit / total_hours if total_hours > 0 else 0
-    sessions_count = len(df)
+    df, kpis = _cached_dashboard_data(sessions_key)
 
     # KPI Row
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        # Show profit with color indicator
-        profit_indicator = "🟢" if total_profit > 0 else "🔴" if total_profit < 0 else "⚪"
-        profit_sign = "+" if total_profit > 0 else ""
-        st.metric("Total P&L", f"{profit_indicator} {profit_sign}${total_profit:.2f}")
-    with col2:
-        st.metric("Sessions", sessions_count)
-    with col3:
-        st.metric("Hours Played", f"{total_hours:.1f}")
-    with col4:
-        st.metric("Avg $/hr", f"${avg_hourly:.2f}")
+    metrics = kpis["metrics"]
+    for col, (label, value) in zip(st.columns(len(metrics)), metrics):
+        col.metric(label, value)
 
     # Load hands once for both PDF and My Edge Card
-    hands = load_hands()
+    hands_mtime = _file_mtime(HANDS_FILE)
+    hands = _cached_hands(hands_mtime)
 
     # PDF Report Download
     from utils.report_generator import generate_tearsheet
-    from datetime import datetime as dt
 
     with st.expander("📄 Generate Performance Report"):
         st.markdown("Export a professional PDF tearsheet with your stats and session history.")
@@ -253,7 +481,7 @@ def render_dashboard():
                 st.download_button(
                     label="Download PDF Tearsheet",
                     data=pdf_bytes,
-                    file_name=f"poker_tearsheet_{dt.now().strftime('%Y%m%d')}.pdf",
+                    file_name=f"poker_tearsheet_{datetime.now().strftime('%Y%m%d')}.pdf",
                     mime="application/pdf",
                     use_container_width=True,
                 )
@@ -262,7 +490,7 @@ def render_dashboard():
 
     # My Edge Card
     if hands:
-        edge_summary = get_edge_summary(hands, sessions)
+        edge_summary = _cached_edge_summary(hands_mtime, sessions_key)
 
         st.subheader("🎯 My Edge")
 
@@ -271,47 +499,32 @@ def render_dashboard():
         with edge_col1:
             st.markdown("**💪 Top Exploits** *(Your Strengths)*")
             if edge_summary["exploits"]:
-                for exploit in edge_summary["exploits"][:3]:
-                    st.markdown(
-                        f'<div style="background: linear-gradient(135deg, #27AE60, #2ECC71); '
-                        f'padding: 10px; border-radius: 8px; margin: 5px 0;">'
-                        f'<span style="color: white; font-weight: bold;">'
-                        f'+{exploit["bb_100"]:.1f} BB/100</span> '
-                        f'<span style="color: #E8F8F5;">{exploit["description"]}</span>'
-                        f'<br><span style="color: #A9DFBF; font-size: 0.8em;">'
-                        f'${exploit["total_profit"]:+,.0f} over {exploit["hands"]} hands</span>'
-                        f'</div>',
-                        unsafe_allow_html=True,
-                    )
+                st.markdown(
+                    "".join(EXPLOIT_CARD_TMPL.format(**e) for e in edge_summary["exploits"][:3]),
+                    unsafe_allow_html=True,
+                )
             else:
                 st.info("Log more hands to identify your strengths")
 
         with edge_col2:
             st.markdown("**🩸 Top Leaks** *(Areas to Improve)*")
             if edge_summary["leaks"]:
-                for leak in edge_summary["leaks"][:3]:
-                    st.markdown(
-                        f'<div style="background: linear-gradient(135deg, #E74C3C, #C0392B); '
-                        f'padding: 10px; border-radius: 8px; margin: 5px 0;">'
-                        f'<span style="color: white; font-weight: bold;">'
-                        f'{leak["bb_100"]:.1f} BB/100</span> '
-                        f'<span style="color: #FADBD8;">{leak["description"]}</span>'
-                        f'<br><span style="color: #F5B7B1; font-size: 0.8em;">'
-                        f'${leak["total_loss"]:+,.0f} over {leak["hands"]} hands</span>'
-                        f'</div>',
-                        unsafe_allow_html=True,
-                    )
+                st.markdown(
+                    "".join(LEAK_CARD_TMPL.format(**leak) for leak in edge_summary["leaks"][:3]),
+                    unsafe_allow_html=True,
+                )
             else:
                 st.info("Log more hands to identify leaks")
 
         # Recommendations
         if edge_summary["recommendations"]:
             with st.expander("📋 Recommendations"):
-                for rec in edge_summary["recommendations"]:
-                    priority_color = {"HIGH": "🔴", "MEDIUM": "🟡", "LOW": "🟢"}.get(rec["priority"], "⚪")
-                    st.markdown(f"{priority_color} **{rec['leak']}** ({rec['bb_100']:.1f} BB/100)")
-                    st.markdown(f"> {rec['recommendation']}")
-                    st.markdown("---")
+                # One markdown block for the whole list rather than three per item
+                st.markdown("\n\n".join(
+                    f"{PRIORITY_ICONS.get(rec['priority'], '⚪')} **{rec['leak']}** ({rec['bb_100']:.1f} BB/100)"
+                    f"\n\n> {rec['recommendation']}\n\n---"
+                    for rec in edge_summary["recommendations"]
+                ))
 
         # Overall BB/100
         overall_bb = edge_summary["overall_bb_100"]
@@ -424,12 +637,10 @@ def render_dashboard():
     # Recent Sessions Table
     st.subheader("Recent Sessions")
 
-    display_df = df[["date", "location", "stake", "buy_in", "cash_out", "profit", "duration_hours"]].copy()
-    display_df.columns = ["Date", "Location", "Stake", "Buy-in", "Cash-out", "Profit", "Hours"]
-    display_df = display_df.sort_values("Date", ascending=False)
-
     st.dataframe(
-        display_df,
+        df,
+        column_config=SESSION_TABLE_CONFIG,
+        column_order=list(SESSION_TABLE_CONFIG),
         use_container_width=True,
         hide_index=True,
     )
@@ -437,18 +648,12 @@ def render_dashboard():
     # Session Management
     st.markdown("---")
     with st.expander("⚙️ Manage Sessions"):
-        # Filter to completed sessions only
-        completed_sessions = [s for s in sessions if s.get("status") != "active"]
+        # Completed sessions only, newest first
+        session_options = _cached_session_options(sessions_key)
 
-        if not completed_sessions:
+        if not session_options:
             st.info("No completed sessions to manage.")
         else:
-            # Session selector
-            session_options = {
-                f"{s.get('date')} - {s.get('location')} ({s.get('stake')}) - ${s.get('profit', 0):+,}": s.get("id")
-                for s in sorted(completed_sessions, key=lambda x: x.get("date", ""), reverse=True)
-            }
-
             selected_label = st.selectbox(
                 "Select Session",
                 options=list(session_options.keys()),
@@ -456,7 +661,7 @@ def render_dashboard():
 
             if selected_label:
                 selected_id = session_options[selected_label]
-                selected_session = get_session(selected_id)
+                selected_session = _cached_session(sessions_key, selected_id)
 
                 if selected_session:
                     col1, col2 = st.columns(2)
@@ -505,30 +710,33 @@ def render_dashboard():
                                     "hourly_rate": round(new_hourly, 2),
                                 }
                                 if update_session(selected_id, updates):
+                                    clear_sessions_cache()
                                     st.success("✅ Session updated!")
                                     st.rerun()
                                 else:
                                     st.error("❌ Failed to update session.")
 
                         # Delete session
+                        # Pending delete confirmation holds the session id, if any
                         st.markdown("---")
                         if st.button("🗑️ Delete Session", type="secondary", use_container_width=True):
-                            st.session_state[f"confirm_delete_{selected_id}"] = True
+                            st.session_state.confirm_delete_id = selected_id
 
-                        if st.session_state.get(f"confirm_delete_{selected_id}"):
+                        if st.session_state.get("confirm_delete_id") == selected_id:
                             st.warning("⚠️ Are you sure? This cannot be undone.")
                             del_col1, del_col2 = st.columns(2)
                             with del_col1:
                                 if st.button("✅ Yes, Delete", use_container_width=True):
                                     if delete_session(selected_id):
+                                        clear_sessions_cache()
                                         st.success("Session deleted.")
-                                        del st.session_state[f"confirm_delete_{selected_id}"]
+                                        st.session_state.pop("confirm_delete_id", None)
                                         st.rerun()
                                     else:
                                         st.error("Failed to delete.")
                             with del_col2:
                                 if st.button("❌ Cancel", use_container_width=True):
-                                    del st.session_state[f"confirm_delete_{selected_id}"]
+                                    st.session_state.pop("confirm_delete_id", None)
                                     st.rerun()
 
 
@@ -537,7 +745,7 @@ def render_log_session():
     # Check if there's an active session
     active_session = None
     if st.session_state.active_session_id:
-        active_session = get_session(st.session_state.active_session_id)
+        active_session = get_active_session()
         if active_session and active_session.get("status") != "active":
             active_session = None
             st.session_state.active_session_id = None
@@ -547,6 +755,7 @@ def render_log_session():
         def end_callback(session_id: int, updates: dict) -> bool:
             success = update_session(session_id, updates)
             if success:
+                clear_sessions_cache()
                 st.session_state.active_session_id = None
             return success
 
@@ -561,6 +770,7 @@ def render_log_session():
             def start_callback(session_data: dict) -> int | None:
                 session_id = save_session(session_data)
                 if session_id:
+                    clear_sessions_cache()
                     st.session_state.active_session_id = session_id
                 return session_id
 
@@ -569,11 +779,20 @@ def render_log_session():
                 st.rerun()
 
         with tab2:
-            render_session_form(on_submit=lambda s: save_session(s) is not None)
+            def log_callback(session_data: dict) -> bool:
+                saved = save_session(session_data) is not None
+                if saved:
+                    clear_sessions_cache()
+                return saved
+
+            render_session_form(on_submit=log_callback)
 
 
 def render_hand_logger():
     """Hand logger page."""
+    from utils.ai_coach import analyze_hand, render_analysis_result, get_api_key, format_cards
+    ss = st.session_state
+
     st.header("🃏 Hand Logger")
 
     # Quick entry at TOP for mobile-first design
@@ -585,17 +804,18 @@ def render_hand_logger():
         label_visibility="collapsed",
     )
 
-    # Parse quick entry for both cards
-    if quick_both:
+    # Parse quick entry for both cards (only when the text changes)
+    if quick_both and quick_both != ss.get("_quick_both_last"):
+        ss["_quick_both_last"] = quick_both
         parsed_cards = parse_multi_cards(quick_both)
         if len(parsed_cards) >= 2:
             # Set both cards in session state
-            st.session_state["card_selector_hole_card_1"] = {
+            ss["card_selector_hole_card_1"] = {
                 "selected_rank": parsed_cards[0][0],
                 "selected_suit": parsed_cards[0][1],
                 "completed_card": parsed_cards[0],
             }
-            st.session_state["card_selector_hole_card_2"] = {
+            ss["card_selector_hole_card_2"] = {
                 "selected_rank": parsed_cards[1][0],
                 "selected_suit": parsed_cards[1][1],
                 "completed_card": parsed_cards[1],
@@ -605,15 +825,15 @@ def render_hand_logger():
 
     # Check for active session
     active_session = None
-    if st.session_state.active_session_id:
-        active_session = get_session(st.session_state.active_session_id)
+    if ss.active_session_id:
+        active_session = get_active_session()
         if active_session and active_session.get("status") != "active":
             active_session = None
 
     if not active_session:
         st.warning("⚠️ **No active session.** Start a session first to log hands.")
         if st.button("➡️ Go to Log Session", use_container_width=True):
-            st.session_state["nav_override"] = "Log Session"
+            ss["nav_override"] = "Log Session"
             st.rerun()
         st.markdown("---")
 
@@ -626,37 +846,38 @@ def render_hand_logger():
     st.markdown("**Or select cards individually:**")
 
     # Get current card selections (dynamic, not accumulated)
-    card1_state = st.session_state.get("card_selector_hole_card_1", {})
-    card2_state = st.session_state.get("card_selector_hole_card_2", {})
+    card1_state = ss.get("card_selector_hole_card_1", {})
+    card2_state = ss.get("card_selector_hole_card_2", {})
     card1 = card1_state.get("completed_card")
     card2 = card2_state.get("completed_card")
 
     col1, col2, col3 = st.columns([1, 1, 1])
+    hole_cards_used = frozenset(filter(None, (card1, card2)))
 
     with col1:
         # Only mark card2 as used (not card1 itself)
-        used_for_card1 = {card2} if card2 else set()
         card1 = render_card_selector(
             "hole_card_1",
-            used_for_card1,
+            hole_cards_used - {card1},
             label="Card 1"
         )
+        hole_cards_used = frozenset(filter(None, (card1, card2)))
 
     with col2:
         # Only mark card1 as used (not card2 itself)
-        used_for_card2 = {card1} if card1 else set()
         card2 = render_card_selector(
             "hole_card_2",
-            used_for_card2,
+            hole_cards_used - {card2},
             label="Card 2"
         )
+        hole_cards_used = frozenset(filter(None, (card1, card2)))
 
     with col3:
         st.markdown("### 🎴 Hand Preview")
         if card1 and card2:
             # Large card display
-            c1_color = "#E74C3C" if card1[1] in ["♥", "♦"] else "#2C3E50"
-            c2_color = "#E74C3C" if card2[1] in ["♥", "♦"] else "#2C3E50"
+            c1_color = SUIT_COLORS[card1[1]]
+            c2_color = SUIT_COLORS[card2[1]]
             st.markdown(
                 f'<div style="font-size: 48px; font-weight: bold; text-align: center; margin: 20px 0;">'
                 f'<span style="color: {c1_color};">{card1[0]}{card1[1]}</span> '
@@ -670,12 +891,6 @@ def render_hand_logger():
                 st.markdown("---")
 
                 # Board cards (optional) - use hole cards as used
-                hole_cards_used = set()
-                if card1:
-                    hole_cards_used.add(card1)
-                if card2:
-                    hole_cards_used.add(card2)
-
                 with st.expander("🃏 Add Board Cards (Optional)", expanded=False):
                     board = render_board_cards(
                         "board",
@@ -704,8 +919,7 @@ def render_hand_logger():
                     opp_col1, opp_col2 = st.columns(2)
                     with opp_col1:
                         # Get existing opponents for autocomplete
-                        existing_opponents = load_opponents()
-                        opponent_names = ["(None)"] + [o.get("name", "") for o in existing_opponents]
+                        opponent_names = _cached_opponent_names(_file_mtime(OPPONENTS_FILE))
                         opponent_select = st.selectbox(
                             "Villain",
                             opponent_names,
@@ -755,14 +969,16 @@ def render_hand_logger():
                     notes = st.text_input("Notes", placeholder="Villain tendencies, key decision...")
 
                     if st.form_submit_button("💾 Log Hand", use_container_width=True):
-                        # Build street actions dict
-                        street_actions = {}
-                        if flop_action != "—":
-                            street_actions["flop"] = flop_action
-                        if turn_action != "—":
-                            street_actions["turn"] = turn_action
-                        if river_action != "—":
-                            street_actions["river"] = river_action
+                        # Build street actions dict (None when every street is "—")
+                        street_actions = {
+                            street: street_action
+                            for street, street_action in (
+                                ("flop", flop_action),
+                                ("turn", turn_action),
+                                ("river", river_action),
+                            )
+                            if street_action != "—"
+                        } or None
 
                         # Handle opponent
                         opponent_id = None
@@ -772,6 +988,7 @@ def render_hand_logger():
                             opp = get_or_create_opponent(new_opponent.strip())
                             opponent_id = opp.get("id")
                             opponent_name = opp.get("name")
+                            clear_opponents_cache()
                         elif opponent_select != "(None)":
                             # Use selected opponent
                             opp = get_or_create_opponent(opponent_select)
@@ -780,10 +997,10 @@ def render_hand_logger():
 
                         hand_data = {
                             "hole_cards": [card1, card2],
-                            "board": board if any(board.values()) else None,
+                            "board": board if board["flop"] or board["turn"] or board["river"] else None,
                             "position": position,
                             "action": preflop_action,
-                            "street_actions": street_actions if street_actions else None,
+                            "street_actions": street_actions,
                             "result": result,
                             "notes": notes,
                             "opponent_id": opponent_id,
@@ -791,6 +1008,7 @@ def render_hand_logger():
                         }
 
                         if save_hand(hand_data, active_session.get("id")):
+                            clear_hands_cache()
                             # Update opponent stats if we have an opponent
                             if opponent_id:
                                 update_opponent_stats(
@@ -801,20 +1019,21 @@ def render_hand_logger():
                                     is_3bet=villain_3bet,
                                     is_cbet=villain_cbet,
                                 )
+                                clear_opponents_cache()
                             st.success("✅ Hand logged!")
 
                             # Store last logged hand for AI Coach
-                            st.session_state["last_logged_hand"] = hand_data
-                            st.session_state["last_logged_session"] = active_session
+                            ss["last_logged_hand"] = hand_data
+                            ss["last_logged_session"] = active_session
 
                             # Ask Coach + GTO Wizard buttons (Location A: after logging)
                             coach_col, gto_col = st.columns(2)
                             with coach_col:
                                 if get_api_key():
                                     if st.button("🤖 Ask Coach", key="ask_coach_new", use_container_width=True):
-                                        st.session_state["analyze_hand"] = hand_data
-                                        st.session_state["analyze_session"] = active_session
-                                        st.session_state["analyze_opponent_id"] = opponent_id
+                                        ss["analyze_hand"] = hand_data
+                                        ss["analyze_session"] = active_session
+                                        ss["analyze_opponent_id"] = opponent_id
                                 else:
                                     st.info("💡 Add API key for AI Coach")
                             with gto_col:
@@ -825,9 +1044,7 @@ def render_hand_logger():
                                 st.link_button("🔗 GTO Wizard", gto_url, use_container_width=True)
 
                             # Reset cards
-                            for k in list(st.session_state.keys()):
-                                if k.startswith("card_selector_") or k.startswith("board_") or k == "quick_both_cards":
-                                    del st.session_state[k]
+                            reset_card_selectors()
                             st.rerun()
                         else:
                             st.error("❌ Failed to log hand.")
@@ -836,17 +1053,15 @@ def render_hand_logger():
 
         if st.button("🔄 Reset All Cards", use_container_width=True):
             # Clear all card selector states
-            for k in list(st.session_state.keys()):
-                if k.startswith("card_selector_") or k.startswith("board_") or k == "quick_both_cards":
-                    del st.session_state[k]
+            reset_card_selectors()
             st.rerun()
 
     # Show AI Coach Analysis if requested
-    if st.session_state.get("analyze_hand"):
+    if ss.get("analyze_hand"):
         st.markdown("---")
-        hand_to_analyze = st.session_state.get("analyze_hand")
-        session_for_analysis = st.session_state.get("analyze_session", active_session or {})
-        opponent_id = st.session_state.get("analyze_opponent_id")
+        hand_to_analyze = ss.get("analyze_hand")
+        session_for_analysis = ss.get("analyze_session", active_session or {})
+        opponent_id = ss.get("analyze_opponent_id")
 
         # Get opponent data with auto-tags if available
         opponent_data = None
@@ -882,34 +1097,38 @@ def render_hand_logger():
         )
 
         if st.button("✖️ Close Analysis", use_container_width=True):
-            del st.session_state["analyze_hand"]
-            if "analyze_session" in st.session_state:
-                del st.session_state["analyze_session"]
-            if "analyze_opponent_id" in st.session_state:
-                del st.session_state["analyze_opponent_id"]
+            del ss["analyze_hand"]
+            if "analyze_session" in ss:
+                del ss["analyze_session"]
+            if "analyze_opponent_id" in ss:
+                del ss["analyze_opponent_id"]
             st.rerun()
 
     # Show logged hands for this session
     if active_session:
-        hands = load_hands(active_session.get("id"))
-        if hands:
+        hand_count, recent_hands = _cached_recent_hands(
+            _file_mtime(HANDS_FILE), active_session.get("id")
+        )
+        if hand_count:
             st.markdown("---")
-            st.subheader(f"📋 Hands This Session ({len(hands)})")
+            st.subheader(f"📋 Hands This Session ({hand_count})")
 
             has_api_key = bool(get_api_key())
 
             # Check if replaying a hand
-            if "replay_hand" in st.session_state and st.session_state["replay_hand"]:
+            if "replay_hand" in ss and ss["replay_hand"]:
                 st.markdown("##### 🎬 Hand Replayer")
-                render_hand_replayer(st.session_state["replay_hand"])
+                render_hand_replayer(ss["replay_hand"])
                 if st.button("✖️ Close Replayer", use_container_width=True):
-                    del st.session_state["replay_hand"]
+                    del ss["replay_hand"]
                     st.rerun()
                 st.markdown("---")
 
-            for idx, hand in enumerate(reversed(hands[-5:])):  # Show last 5
+            for idx, hand in enumerate(recent_hands):  # Last 5, newest first
                 cards = hand.get("hole_cards", [])
-                card_str = f"{cards[0][0]}{cards[0][1]} {cards[1][0]}{cards[1][1]}" if len(cards) == 2 else "?"
+                card_str = format_cards(cards) if len(cards) == 2 else "?"
+                position = hand.get("position")
+                action = hand.get("action")
                 result = hand.get("result", 0)
                 color = "green" if result >= 0 else "red"
                 villain = hand.get("opponent_name", "")
@@ -920,26 +1139,28 @@ def render_hand_logger():
 
                 with hand_col:
                     st.markdown(
-                        f"**{card_str}** | {hand.get('position')} | {hand.get('action')} | "
+                        f"**{card_str}** | {position} | {action} | "
                         f":{color}[${result:+}]{villain_str}"
                     )
 
                 with replay_col:
                     if st.button("🎬", key=f"replay_hand_{idx}", help="Replay Hand"):
-                        st.session_state["replay_hand"] = hand
+                        ss["replay_hand"] = hand
                         st.rerun()
 
                 with coach_col:
                     if has_api_key:
                         if st.button("🤖", key=f"coach_hand_{idx}", help="Ask AI Coach"):
-                            st.session_state["analyze_hand"] = hand
-                            st.session_state["analyze_session"] = active_session
-                            st.session_state["analyze_opponent_id"] = hand.get("opponent_id")
+                            ss["analyze_hand"] = hand
+                            ss["analyze_session"] = active_session
+                            ss["analyze_opponent_id"] = hand.get("opponent_id")
                             st.rerun()
 
 
 def render_data_import():
     """Ignition import page."""
+    from utils.ignition_parser import parse_ignition_file, get_import_summary
+
     st.header("📥 Data Import")
     st.markdown("Import hand histories from **Ignition Casino** (Zone Poker)")
 
@@ -962,17 +1183,23 @@ def render_data_import():
 
     if uploaded_files:
         # Parse each file separately to support per-file sessions
-        files_data = []  # List of {filename, hands, new_hands, duplicates}
+        files_data = []  # List of {filename, hands, new_hands, new_profit, duplicates}
         file_count = len(uploaded_files)
         existing_hand_ids = get_existing_hand_ids()
 
         with st.spinner(f"Parsing {file_count} file(s)..."):
             for uploaded_file in uploaded_files:
-                file_content = uploaded_file.read().decode('utf-8')
-                parsed_hands = parse_ignition_file(file_content)
+                # Decode and parse line by line rather than reading the whole file into one string
+                text = io.TextIOWrapper(uploaded_file, encoding='utf-8', newline='')
+                try:
+                    parsed_hands = parse_ignition_file(text)
+                finally:
+                    # Leave the upload open, even if parsing fails; the wrapper would close it on collection
+                    text.detach()
 
                 # Filter duplicates for this file
                 new_hands = []
+                new_profit = 0
                 duplicate_hands = []
                 for hand in parsed_hands:
                     hand_id = hand.get('hand_id')
@@ -980,6 +1207,7 @@ def render_data_import():
                         duplicate_hands.append(hand)
                     else:
                         new_hands.append(hand)
+                        new_profit += hand.get('result', 0)
                         if hand_id:
                             existing_hand_ids.add(hand_id)
 
@@ -987,6 +1215,7 @@ def render_data_import():
                     'filename': uploaded_file.name,
                     'all_hands': parsed_hands,
                     'new_hands': new_hands,
+                    'new_profit': new_profit,
                     'duplicates': duplicate_hands,
                 })
 
@@ -1001,19 +1230,21 @@ def render_data_import():
 
         # Show per-file breakdown
         st.markdown("### 📁 Files Uploaded")
+        file_lines = []
         for f in files_data:
             new_ct = len(f['new_hands'])
             dup_ct = len(f['duplicates'])
             if new_ct > 0:
-                file_profit = sum(h.get('result', 0) for h in f['new_hands'])
+                file_profit = f['new_profit']
                 profit_color = "green" if file_profit >= 0 else "red"
-                st.markdown(
+                file_lines.append(
                     f"**{f['filename']}**: {new_ct} new hands "
                     f"(:{profit_color}[${file_profit:+.2f}])"
                     + (f", {dup_ct} duplicates skipped" if dup_ct > 0 else "")
                 )
             else:
-                st.markdown(f"**{f['filename']}**: All {dup_ct} hands already imported")
+                file_lines.append(f"**{f['filename']}**: All {dup_ct} hands already imported")
+        st.markdown("\n\n".join(file_lines))
 
         if total_dups > 0:
             st.warning(f"📊 Total: **{total_parsed}** hands parsed, **{total_new}** new, **{total_dups}** duplicates skipped")
@@ -1067,8 +1298,6 @@ def render_data_import():
         # Import button
         if st.button("📥 Import Hands", type="primary", use_container_width=True):
             with st.spinner("Importing hands..."):
-                from datetime import datetime
-
                 total_success = 0
                 sessions_created = 0
 
@@ -1091,7 +1320,7 @@ def render_data_import():
                         most_common_stake = max(set(stakes), key=stakes.count)
 
                         # Calculate session stats
-                        total_profit = sum(h.get('result', 0) for h in hands)
+                        total_profit = f['new_profit']
                         duration = max(0.5, len(hands) / 60)  # ~60 hands/hour
 
                         # Calculate buy-in and cash-out from stack sizes
@@ -1119,13 +1348,11 @@ def render_data_import():
                         session_id = save_session(session_data)
                         if session_id:
                             sessions_created += 1
-                            for hand in hands:
-                                if save_hand(hand, session_id):
-                                    total_success += 1
+                            total_success += save_hands(hands, session_id)
 
                 else:
                     # Combined mode - one session for all files
-                    all_hands = [h for f in files_data for h in f['new_hands']]
+                    all_hands = all_new_hands
                     if all_hands:
                         first_date = all_hands[0].get('date', datetime.now().isoformat())
                         if isinstance(first_date, str):
@@ -1136,7 +1363,7 @@ def render_data_import():
                         stakes = [h.get('stake', '0.05/0.10') for h in all_hands]
                         most_common_stake = max(set(stakes), key=stakes.count)
 
-                        total_profit = sum(h.get('result', 0) for h in all_hands)
+                        total_profit = sum(f['new_profit'] for f in files_data)
                         duration = max(1, len(all_hands) / 60)
 
                         # Calculate buy-in and cash-out from stack sizes
@@ -1162,11 +1389,12 @@ def render_data_import():
                         session_id = save_session(session_data)
                         if session_id:
                             sessions_created = 1
-                            for hand in all_hands:
-                                if save_hand(hand, session_id):
-                                    total_success += 1
+                            total_success += save_hands(all_hands, session_id)
 
+            if sessions_created:
+                clear_sessions_cache()
             if total_success > 0:
+                clear_hands_cache()
                 st.success(f"✅ Imported **{total_success}** hands into **{sessions_created}** session(s)!")
                 st.balloons()
 
@@ -1183,92 +1411,49 @@ def render_data_import():
     st.markdown("---")
     st.subheader("📊 Import History")
 
-    sessions = load_sessions()
-    imported_sessions = [s for s in sessions if s.get('source') == 'ignition_import']
+    imported_sessions = _cached_import_history(_sessions_key())
 
     if imported_sessions:
-        for session in sorted(imported_sessions, key=lambda x: x.get('date', ''), reverse=True)[:5]:
-            st.markdown(
-                f"**{session.get('date')}** - {session.get('location')} | "
-                f"${session.get('profit', 0):+.2f} | {session.get('notes', '')}"
-            )
+        st.markdown("\n\n".join(
+            f"**{session.get('date')}** - {session.get('location')} | "
+            f"${session.get('profit', 0):+.2f} | {session.get('notes', '')}"
+            for session in imported_sessions
+        ))
     else:
         st.info("No imported sessions yet. Upload a hand history file above to get started.")
 
 
-def render_my_ranges():
-    """Range chart page."""
-    import plotly.graph_objects as go
-
-    st.header("📊 My Ranges")
-    st.markdown("Visualize your actual playing ranges by position")
-
-    # Load all hands
-    hands = load_hands()
+# Display order for the My Ranges position breakdown
+POSITION_ORDER = {pos: i for i, pos in enumerate(['EP', 'MP', 'CO', 'BTN', 'SB', 'BB'])}
 
-    if not hands:
-        st.warning("No hands logged yet. Import hand histories or log hands manually to see your ranges.")
-        return
 
-    # Position filter
-    positions = ['All Positions', 'BTN', 'CO', 'MP', 'EP', 'SB', 'BB']
-
-    col1, col2, col3 = st.columns([2, 2, 2])
-    with col1:
-        selected_position = st.selectbox(
-            "Position",
-            options=positions,
-            index=0,
-        )
-    with col2:
-        view_mode = st.selectbox(
-            "View Mode",
-            options=['Frequency', 'Profit', 'Win Rate'],
-            index=0,
-        )
-    with col3:
-        color_scheme = st.selectbox(
-            "Color Scheme",
-            options=['Green/Red', 'Blue', 'Heat'],
-            index=0,
-        )
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_range_figure(
+    hands_mtime: int,
+    pos_filter: str | None,
+    view_mode: str,
+    color_scheme: str,
+) -> tuple[dict, list[list[dict]]]:
+    """(Range heatmap figure as a dict, the grid it was built from), rebuilt only when inputs change."""
+    from utils.range_analyzer import get_range_grid_data, RANKS
 
-    # Get position filter
-    pos_filter = None if selected_position == 'All Positions' else selected_position
-
-    # Analyze ranges
-    range_data = analyze_ranges(hands, pos_filter)
+    range_data = _cached_range_data(hands_mtime, pos_filter)
     grid_data = get_range_grid_data(
         range_data['matrix'],
         mode=view_mode.lower().replace(' ', '')
     )
 
-    # Show summary stats
-    st.markdown("---")
-    stat_cols = st.columns(4)
-    with stat_cols[0]:
-        st.metric("Total Hands", range_data['total_hands'])
-    with stat_cols[1]:
-        st.metric("VPIP Hands", range_data['vpip_hands'])
-    with stat_cols[2]:
-        st.metric("VPIP %", f"{range_data['vpip_pct']}%")
-    with stat_cols[3]:
-        total_profit = sum(cell['profit'] for row in grid_data for cell in row)
-        profit_color = "green" if total_profit >= 0 else "red"
-        st.metric("Total Profit", f"${total_profit:+.2f}")
-
-    st.markdown("---")
-
     # Build the heatmap
     # Create labels and values matrices
     z_values = []
     hover_text = []
-    annotations = []
+    cell_labels = []
 
-    for row_idx, row in enumerate(grid_data):
+    for row in grid_data:
         z_row = []
         hover_row = []
-        for col_idx, cell in enumerate(row):
+        label_row = []
+        for cell in row:
             # Value for color intensity
             if view_mode == 'Frequency':
                 z_row.append(cell['count'])
@@ -1286,20 +1471,15 @@ def render_my_ranges():
                 f"Win Rate: {cell['winrate']}%"
             )
 
-            # Annotation (hand name)
-            annotations.append(dict(
-                x=col_idx,
-                y=row_idx,
-                text=cell['hand'],
-                font=dict(
-                    size=10,
-                    color='white' if cell['count'] > 0 else 'gray'
-                ),
-                showarrow=False,
-            ))
+            # Cell label (hand name), greyed out for unplayed hands
+            label_row.append(
+                cell['hand'] if cell['count'] > 0
+                else f"<span style='color:gray'>{cell['hand']}</span>"
+            )
 
         z_values.append(z_row)
         hover_text.append(hover_row)
+        cell_labels.append(label_row)
 
     # Color scale based on selection
     if color_scheme == 'Green/Red':
@@ -1318,6 +1498,9 @@ def render_my_ranges():
         y=RANKS,
         hovertext=hover_text,
         hoverinfo='text',
+        text=cell_labels,
+        texttemplate='%{text}',
+        textfont=dict(size=10, color='white'),
         colorscale=colorscale,
         showscale=True,
         colorbar=dict(
@@ -1326,9 +1509,7 @@ def render_my_ranges():
         ),
     ))
 
-    # Add annotations
     fig.update_layout(
-        annotations=annotations,
         xaxis=dict(
             title='',
             tickvals=list(range(13)),
@@ -1347,88 +1528,152 @@ def render_my_ranges():
         plot_bgcolor='rgba(0,0,0,0)',
     )
 
+    return fig.to_dict(), grid_data
+
+
+def render_my_ranges():
+    """Range chart page."""
+    st.header("📊 My Ranges")
+    st.markdown("Visualize your actual playing ranges by position")
+
+    # Load all hands
+    hands_mtime = _file_mtime(HANDS_FILE)
+    hands = _cached_hands(hands_mtime)
+
+    if not hands:
+        st.warning("No hands logged yet. Import hand histories or log hands manually to see your ranges.")
+        return
+
+    # Position filter
+    positions = ['All Positions', 'BTN', 'CO', 'MP', 'EP', 'SB', 'BB']
+
+    col1, col2, col3 = st.columns([2, 2, 2])
+    with col1:
+        selected_position = st.selectbox(
+            "Position",
+            options=positions,
+            index=0,
+        )
+    with col2:
+        view_mode = st.selectbox(
+            "View Mode",
+            options=['Frequency', 'Profit', 'Win Rate'],
+            index=0,
+        )
+    with col3:
+        color_scheme = st.selectbox(
+            "Color Scheme",
+            options=['Green/Red', 'Blue', 'Heat'],
+            index=0,
+        )
+
+    # Get position filter
+    pos_filter = None if selected_position == 'All Positions' else selected_position
+
+    # Analyze ranges (view mode and colors don't change the analysis)
+    range_data = _cached_range_data(hands_mtime, pos_filter)
+    # Figure and grid are cached together; only rebuilt when the hands or chart options change
+    fig_dict, grid_data = _cached_range_figure(hands_mtime, pos_filter, view_mode, color_scheme)
+    # Flat 169-row frame for the totals and top/worst lists below
+    cells_df = pd.DataFrame([cell for row in grid_data for cell in row])
+
+    # Show summary stats
+    st.markdown("---")
+    stat_cols = st.columns(4)
+    with stat_cols[0]:
+        st.metric("Total Hands", range_data['total_hands'])
+    with stat_cols[1]:
+        st.metric("VPIP Hands", range_data['vpip_hands'])
+    with stat_cols[2]:
+        st.metric("VPIP %", f"{range_data['vpip_pct']}%")
+    with stat_cols[3]:
+        total_profit = cells_df['profit'].sum()
+        profit_color = "green" if total_profit >= 0 else "red"
+        st.metric("Total Profit", f"${total_profit:+.2f}")
+
+    st.markdown("---")
+
+    fig = go.Figure(fig_dict)
     st.plotly_chart(fig, use_container_width=True)
 
     # Position breakdown
     st.markdown("---")
     st.subheader("📍 Position Breakdown")
 
-    position_stats = get_position_summary(hands)
+    position_stats = _cached_position_summary(hands_mtime)
 
     if position_stats:
         # Sort by standard position order
-        pos_order = ['EP', 'MP', 'CO', 'BTN', 'SB', 'BB']
         sorted_positions = sorted(
             position_stats.items(),
-            key=lambda x: pos_order.index(x[0]) if x[0] in pos_order else 99
+            key=lambda x: POSITION_ORDER.get(x[0], 99)
         )
 
         pos_cols = st.columns(min(6, len(sorted_positions)))
         for i, (pos, stats) in enumerate(sorted_positions[:6]):
             with pos_cols[i % 6]:
                 profit_color = "🟢" if stats['profit'] >= 0 else "🔴"
-                st.markdown(f"**{pos}**")
-                st.markdown(f"Hands: {stats['hands']}")
-                st.markdown(f"VPIP: {stats['vpip_pct']}%")
-                st.markdown(f"PFR: {stats['pfr_pct']}%")
-                st.markdown(f"{profit_color} ${stats['profit']:+.2f}")
+                st.markdown(
+                    f"**{pos}**\n\n"
+                    f"Hands: {stats['hands']}\n\n"
+                    f"VPIP: {stats['vpip_pct']}%\n\n"
+                    f"PFR: {stats['pfr_pct']}%\n\n"
+                    f"{profit_color} ${stats['profit']:+.2f}"
+                )
 
     # Top hands analysis
     st.markdown("---")
     st.subheader("🏆 Top Performing Hands")
 
-    # Flatten grid and sort by profit
-    all_hands = []
-    for row in grid_data:
-        for cell in row:
-            if cell['count'] > 0:
-                all_hands.append(cell)
-
-    # Sort by profit
-    top_profitable = sorted(all_hands, key=lambda x: x['profit'], reverse=True)[:10]
-    most_played = sorted(all_hands, key=lambda x: x['count'], reverse=True)[:10]
+    # Played hands only; partial top-k selection instead of full sorts
+    played = cells_df[cells_df['count'] > 0]
+    top_profitable = played.nlargest(5, 'profit').to_dict('records')
+    most_played = played.nlargest(5, 'count').to_dict('records')
 
     top_col1, top_col2 = st.columns(2)
 
     with top_col1:
-        st.markdown("**💰 Most Profitable**")
-        for hand in top_profitable[:5]:
+        lines = ["**💰 Most Profitable**"]
+        for hand in top_profitable:
             color = "green" if hand['profit'] >= 0 else "red"
-            st.markdown(
+            lines.append(
                 f"**{hand['hand']}** - :{color}[${hand['profit']:+.2f}] "
                 f"({hand['count']} hands, {hand['winrate']}% win)"
             )
+        st.markdown("\n\n".join(lines))
 
     with top_col2:
-        st.markdown("**📈 Most Played**")
-        for hand in most_played[:5]:
+        lines = ["**📈 Most Played**"]
+        for hand in most_played:
             color = "green" if hand['profit'] >= 0 else "red"
-            st.markdown(
+            lines.append(
                 f"**{hand['hand']}** - {hand['count']} hands "
                 f"(:{color}[${hand['profit']:+.2f}], {hand['winrate']}% win)"
             )
+        st.markdown("\n\n".join(lines))
 
     # Worst hands
     st.markdown("---")
     st.subheader("⚠️ Leak Detection")
 
-    worst_hands = sorted(all_hands, key=lambda x: x['profit'])[:5]
+    worst_hands = played.nsmallest(5, 'profit').to_dict('records')
     if worst_hands and worst_hands[0]['profit'] < 0:
-        st.markdown("**Hands losing the most money:**")
+        lines = ["**Hands losing the most money:**"]
         for hand in worst_hands:
             if hand['profit'] < 0:
-                st.markdown(
+                lines.append(
                     f"**{hand['hand']}** - :red[${hand['profit']:.2f}] "
                     f"({hand['count']} hands, {hand['winrate']}% win)"
                 )
+        st.markdown("\n\n".join(lines))
     else:
         st.success("No significant leaks detected! All hands are profitable or break-even.")
 
 
 def render_analytics():
     """Analytics page."""
-    sessions = load_sessions()
-    hands = load_hands()
+    sessions = _cached_sessions(_sessions_key())
+    hands = _cached_hands(_file_mtime(HANDS_FILE))
     render_analytics_page(sessions, hands)
 
 
@@ -1438,9 +1683,7 @@ def render_simulator():
     st.markdown("*Risk of Ruin analysis using Monte Carlo simulation*")
 
     # Get current stats from sessions for defaults
-    sessions = load_sessions()
-    hands = load_hands()
-    edge = get_edge_summary(hands, sessions)
+    edge = _cached_edge_summary(_file_mtime(HANDS_FILE), _sessions_key())
 
     # Default values from actual data or reasonable estimates
     default_winrate = edge.get('bb_per_100', 5.0) if edge.get('total_hands', 0) > 100 else 5.0
@@ -1831,7 +2074,6 @@ def render_simulator():
 
 def render_quant_lab():
     """Quant lab - GARCH, clustering, bayesian stuff."""
-    import pandas as pd
     from analytics.volatility import VolatilityModel, render_volatility_chart
     from analytics.clustering import VillainCluster, render_cluster_chart
     from analytics.bayesian import WinrateEstimator, render_posterior_chart
@@ -1840,9 +2082,9 @@ def render_quant_lab():
     st.markdown("*Advanced statistical analysis for edge quantification*")
 
     # Load data
-    sessions = load_sessions()
-    hands = load_hands()
-    opponents = load_opponents()
+    sessions = _cached_sessions(_sessions_key())
+    hands = _cached_hands(_file_mtime(HANDS_FILE))
+    opponents = _cached_opponents(_file_mtime(OPPONENTS_FILE))
 
     # Create tabs
     tab1, tab2, tab3 = st.tabs([
@@ -2023,13 +2265,13 @@ def render_quant_lab():
     with tab3:
         st.subheader("True Winrate Estimation (Bootstrap)")
         st.markdown("""
-        Uses **Bootstrap resampling** (10,000 iterations) to estimate the
+        Uses **balanced bootstrap resampling** (5,000 iterations) to estimate the
         posterior distribution of your true winrate and calculate confidence intervals.
         """)
 
         # Get hand results in BB
         if hands and len(hands) >= 100:
-            hand_results = [h.get('result', 0) for h in hands if h.get('result') is not None]
+            hand_results = [r for h in hands if (r := h.get('result')) is not None]
 
             if len(hand_results) >= 100:
                 # Render posterior chart
@@ -2057,13 +2299,13 @@ def render_quant_lab():
 
                     with col2:
                         st.metric(
-                            "95% CI Lower",
+                            "95% HDI Lower",
                             f"{summary['hdi_lower']:.2f} BB/100",
                         )
 
                     with col3:
                         st.metric(
-                            "95% CI Upper",
+                            "95% HDI Upper",
                             f"{summary['hdi_upper']:.2f} BB/100",
                         )
 
@@ -1,6 +1,6 @@
 # Components package
 
-from .card_selector import render_card_selector, get_card_display, render_board_cards, parse_multi_cards
+from .card_selector import render_card_selector, get_card_display, render_board_cards, parse_multi_cards, reset_card_selectors, SUIT_COLORS
 from .session_form import render_session_form, render_start_session_form, render_end_session_form
 from .analytics import render_analytics_page
 from .hand_visualizer import render_hand_visualizer, render_hand_compact, render_cards_inline
@@ -13,6 +13,8 @@ __all__ = [
     "get_card_display",
     "render_board_cards",
     "parse_multi_cards",
+    "reset_card_selectors",
+    "SUIT_COLORS",
     "render_session_form",
     "render_start_session_form",
     "render_end_session_form",
@@ -6,6 +6,7 @@ dead card tracking, and keyboard shortcuts for rapid entry.
 
 import streamlit as st
 import re
+from functools import lru_cache
 from typing import Optional
 
 
@@ -30,6 +31,47 @@ SUIT_MAP = {
 # Valid rank characters
 VALID_RANKS = set("AKQJT98765432")
 
+# Integer card codes: rank_idx * 4 + suit_idx (0-51), so a set of cards is
+# a 52-bit mask and each rank owns 4 consecutive bits
+CARD_RANKS = "23456789TJQKA"
+CARD_SUITS = "♣♦♥♠"
+_RANK_INDEX = {r: i for i, r in enumerate(CARD_RANKS)}
+_SUIT_INDEX = {s: i for i, s in enumerate(CARD_SUITS)}
+
+
+def encode_card(card: tuple[str, str]) -> int:
+    """(rank, suit) -> 0-51 card code."""
+    return _RANK_INDEX[card[0]] * 4 + _SUIT_INDEX[card[1]]
+
+
+def decode_card(code: int) -> tuple[str, str]:
+    """0-51 card code -> (rank, suit)."""
+    return CARD_RANKS[code // 4], CARD_SUITS[code % 4]
+
+
+def cards_to_mask(cards) -> int:
+    """Bitmask with one bit set per card code."""
+    mask = 0
+    for card in cards:
+        mask |= 1 << encode_card(card)
+    return mask
+
+# Session state registry of card selector/board keys, for targeted resets
+CARD_WIDGET_KEYS = "_card_widget_keys"
+
+
+def _register_card_keys(*keys: str) -> None:
+    """Record session state keys owned by card entry widgets."""
+    st.session_state.setdefault(CARD_WIDGET_KEYS, set()).update(keys)
+
+
+def reset_card_selectors() -> None:
+    """Clear all card selector and board entry state."""
+    for k in st.session_state.pop(CARD_WIDGET_KEYS, set()):
+        st.session_state.pop(k, None)
+    st.session_state.pop("quick_both_cards", None)
+    st.session_state.pop("_quick_both_last", None)
+
 
 def _apply_card_selector_styles() -> None:
     """Apply custom CSS styling for card selector."""
@@ -190,9 +232,16 @@ def parse_multi_cards(text: str) -> list[tuple[str, str]]:
     Returns:
         List of (rank, suit) tuples for valid cards found.
     """
+    # Fresh list per call so callers can't mutate the cached result
+    return list(_parse_multi_cards(text))
+
+
+@lru_cache(maxsize=256)
+def _parse_multi_cards(text: str) -> tuple[tuple[str, str], ...]:
+    """parse_multi_cards() memoized on the raw input text."""
     text = text.strip().upper()
     if not text:
-        return []
+        return ()
 
     cards = []
 
@@ -219,7 +268,7 @@ def parse_multi_cards(text: str) -> list[tuple[str, str]]:
             else:
                 i += 1
 
-    return cards
+    return tuple(cards)
 
 
 def render_card_selector(
@@ -249,15 +298,15 @@ def render_card_selector(
         >>> if card:
         ...     st.write(f"Selected: {card[0]}{card[1]}")
     """
-    # Initialize used cards set
-    if used_cards is None:
-        used_cards = set()
+    # Used cards as a bitmask: membership and per-rank checks are bit tests
+    used_mask = cards_to_mask(used_cards or ())
 
     # Apply custom styles
     _apply_card_selector_styles()
 
     # Initialize session state for this selector
     state_key = f"card_selector_{key}"
+    _register_card_keys(state_key)
     if state_key not in st.session_state:
         st.session_state[state_key] = {
             "selected_rank": None,
@@ -287,7 +336,7 @@ def render_card_selector(
 
     if quick_input:
         parsed = parse_card_input(quick_input)
-        if parsed and parsed not in used_cards:
+        if parsed and not used_mask >> encode_card(parsed) & 1:
             state["selected_rank"] = parsed[0]
             state["selected_suit"] = parsed[1]
             state["completed_card"] = parsed
@@ -300,10 +349,8 @@ def render_card_selector(
 
     for idx, rank in enumerate(RANKS):
         with rank_cols[idx]:
-            # Check if any card with this rank is available
-            rank_available = any(
-                (rank, suit) not in used_cards for suit in SUITS
-            )
+            # Check if any card with this rank is available (its 4 bits not all set)
+            rank_available = (used_mask >> (_RANK_INDEX[rank] * 4)) & 0xF != 0xF
 
             if st.button(
                 rank,
@@ -326,7 +373,7 @@ def render_card_selector(
         for idx, suit in enumerate(SUITS):
             with suit_cols[idx]:
                 card = (state["selected_rank"], suit)
-                is_used = card in used_cards
+                is_used = bool(used_mask >> encode_card(card) & 1)
 
                 # Style button with suit color
                 button_html = f"""
@@ -413,6 +460,7 @@ def render_board_cards(
         used_cards = set()
 
     board = {"flop": [], "turn": [], "river": []}
+    _register_card_keys(f"{key}_flop", f"{key}_turn", f"{key}_river")
 
     st.markdown("**Board Cards** *(optional - type like `As Kh Td` for flop)*")
 
@@ -0,0 +1,48 @@
+"""Regression tests for the bootstrap winrate estimator."""
+
+import numpy as np
+
+from analytics.bayesian import WinrateEstimator, _cpu_bootstrap
+
+
+def test_large_history_past_hypergeometric_limit():
+    """200k hands x 5k resamples passes the 1e9-draw sampler limit."""
+    hand_results = np.random.default_rng(0).standard_normal(200_000)
+
+    model = WinrateEstimator(hand_results)
+    summary = model.get_summary()
+
+    assert summary['status'] == 'Complete'
+    assert summary['sample_size'] == 200_000
+    assert model.hdi_lower <= model.point_estimate <= model.hdi_upper
+
+
+def test_balanced_resamples_average_to_observed_winrate():
+    """Each hand is drawn n_bootstrap times, so the resample means average exactly."""
+    hand_results = np.random.default_rng(1).standard_normal(500).astype(np.float32)
+
+    samples = _cpu_bootstrap(hand_results, 200)
+
+    expected = hand_results.mean(dtype=np.float64) * 100
+    assert abs(samples.mean(dtype=np.float64) - expected) < 1e-3
+
+
+def test_hdi_with_one_or_two_resamples():
+    """The narrowest-window HDI still works at the smallest n_bootstrap."""
+    hand_results = np.random.default_rng(2).standard_normal(200)
+
+    for n_bootstrap in (1, 2):
+        model = WinrateEstimator(hand_results, n_bootstrap=n_bootstrap)
+
+        assert model.get_summary()['status'] == 'Complete'
+        assert model.samples.min() <= model.hdi_lower <= model.hdi_upper <= model.samples.max()
+
+
+def test_hdi_holds_the_confidence_share_of_samples():
+    """A 95% HDI over 5k resamples spans ceil(0.95 * 5000) sorted samples."""
+    hand_results = np.random.default_rng(3).standard_normal(1_000)
+
+    model = WinrateEstimator(hand_results)
+
+    inside = np.count_nonzero((model.samples >= model.hdi_lower) & (model.samples <= model.hdi_upper))
+    assert inside >= 4750
@@ -1,26 +1,35 @@
 # Utils package
+#
+# Submodules are imported on first attribute access, so importing e.g.
+# utils.data_loader doesn't pull in the AI coach, parser and PDF stack.
 
-from .ai_coach import (
-    analyze_hand,
-    get_api_key,
-    render_api_key_input,
-    render_analysis_result,
-)
+import importlib
 
-from .ignition_parser import (
-    parse_ignition_file,
-    get_import_summary,
-)
+_EXPORTS = {
+    # ai_coach
+    "analyze_hand": "ai_coach",
+    "get_api_key": "ai_coach",
+    "render_api_key_input": "ai_coach",
+    "render_analysis_result": "ai_coach",
+    # ignition_parser
+    "parse_ignition_file": "ignition_parser",
+    "get_import_summary": "ignition_parser",
+    # poker_math
+    "calculate_winrate_ci": "poker_math",
+    "get_sample_size_message": "poker_math",
+    "hands_needed_for_confidence": "poker_math",
+    "calculate_hourly_rate_ci": "poker_math",
+    # report_generator
+    "generate_tearsheet": "report_generator",
+    "render_download_button": "report_generator",
+    "calculate_report_metrics": "report_generator",
+}
 
-from .poker_math import (
-    calculate_winrate_ci,
-    get_sample_size_message,
-    hands_needed_for_confidence,
-    calculate_hourly_rate_ci,
-)
+__all__ = list(_EXPORTS)
 
-from .report_generator import (
-    generate_tearsheet,
-    render_download_button,
-    calculate_report_metrics,
-)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
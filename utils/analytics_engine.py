@@ -5,7 +5,8 @@ and generates actionable leak recommendations.
 """
 
 from typing import Optional
-from collections import defaultdict
+
+import numpy as np
 
 
 def parse_stake_to_bb(stake: str) -> float:
@@ -26,87 +27,101 @@ def parse_stake_to_bb(stake: str) -> float:
     return 2.0  # Default to $2 BB
 
 
-def calculate_position_stats(hands: list[dict], sessions: list[dict]) -> dict:
-    """Calculate win/loss statistics by position.
+def _hand_results(hands: list[dict], sessions: list[dict]) -> tuple:
+    """Convert hands to arrays of dollar results and BB-normalized results.
 
     Args:
         hands: List of hand dictionaries.
         sessions: List of session dictionaries (for stake context).
 
     Returns:
-        Dictionary with position stats including BB/100, total profit, hand count.
+        Tuple of (results, bb_results) float arrays, one entry per hand.
     """
     # Build session lookup for stake info
     session_stakes = {}
     for s in sessions:
         session_stakes[s.get("id")] = parse_stake_to_bb(s.get("stake", "1/2"))
 
-    # Aggregate by position
-    position_data = defaultdict(lambda: {"profit": 0, "hands": 0, "bb_profit": 0})
+    results = np.fromiter(
+        (hand.get("result", 0) for hand in hands), dtype=np.float64, count=len(hands)
+    )
+    bbs = np.fromiter(
+        (session_stakes.get(hand.get("session_id"), 2.0) for hand in hands),
+        dtype=np.float64,
+        count=len(hands),
+    )
+    bb_results = np.divide(results, bbs, out=np.zeros_like(results), where=bbs > 0)
 
-    for hand in hands:
-        pos = hand.get("position", "Unknown")
-        result = hand.get("result", 0)
-        session_id = hand.get("session_id")
-        bb = session_stakes.get(session_id, 2.0)
+    return results, bb_results
 
-        position_data[pos]["profit"] += result
-        position_data[pos]["hands"] += 1
-        position_data[pos]["bb_profit"] += result / bb if bb > 0 else 0
 
-    # Calculate BB/100
+def _group_stats(keys: list, results: np.ndarray, bb_results: np.ndarray) -> dict:
+    """Sum profit, hand count and BB profit per key, in first-seen key order.
+
+    Args:
+        keys: Group key for each hand.
+        results: Dollar result for each hand.
+        bb_results: BB-normalized result for each hand.
+
+    Returns:
+        Dictionary mapping each key to its profit, hands, bb_profit and bb_100.
+    """
+    # Map keys to dense bucket ids, then let bincount do the per-bucket sums
+    bucket_index = {}
+    bucket_ids = np.fromiter(
+        (bucket_index.setdefault(key, len(bucket_index)) for key in keys),
+        dtype=np.intp,
+        count=len(keys),
+    )
+    n_buckets = len(bucket_index)
+    profits = np.bincount(bucket_ids, weights=results, minlength=n_buckets)
+    counts = np.bincount(bucket_ids, minlength=n_buckets)
+    bb_profits = np.bincount(bucket_ids, weights=bb_results, minlength=n_buckets)
+
     stats = {}
-    for pos, data in position_data.items():
-        hands_count = data["hands"]
-        bb_100 = (data["bb_profit"] / hands_count * 100) if hands_count > 0 else 0
-        stats[pos] = {
-            "profit": data["profit"],
+    for key, i in bucket_index.items():
+        hands_count = int(counts[i])
+        bb_100 = (bb_profits[i] / hands_count * 100) if hands_count > 0 else 0
+        stats[key] = {
+            "profit": float(profits[i]),
             "hands": hands_count,
-            "bb_profit": round(data["bb_profit"], 2),
-            "bb_100": round(bb_100, 2),
+            "bb_profit": round(float(bb_profits[i]), 2),
+            "bb_100": round(float(bb_100), 2),
         }
 
     return stats
 
 
-def calculate_action_stats(hands: list[dict], sessions: list[dict]) -> dict:
-    """Calculate win/loss statistics by preflop action.
+def calculate_position_stats(hands: list[dict], sessions: list[dict]) -> dict:
+    """Calculate win/loss statistics by position.
 
     Args:
         hands: List of hand dictionaries.
-        sessions: List of session dictionaries.
+        sessions: List of session dictionaries (for stake context).
 
     Returns:
-        Dictionary with action stats including BB/100, total profit, hand count.
+        Dictionary with position stats including BB/100, total profit, hand count.
     """
-    session_stakes = {}
-    for s in sessions:
-        session_stakes[s.get("id")] = parse_stake_to_bb(s.get("stake", "1/2"))
+    results, bb_results = _hand_results(hands, sessions)
+    positions = [hand.get("position", "Unknown") for hand in hands]
 
-    action_data = defaultdict(lambda: {"profit": 0, "hands": 0, "bb_profit": 0})
+    return _group_stats(positions, results, bb_results)
 
-    for hand in hands:
-        action = hand.get("action", "unknown")
-        result = hand.get("result", 0)
-        session_id = hand.get("session_id")
-        bb = session_stakes.get(session_id, 2.0)
 
-        action_data[action]["profit"] += result
-        action_data[action]["hands"] += 1
-        action_data[action]["bb_profit"] += result / bb if bb > 0 else 0
+def calculate_action_stats(hands: list[dict], sessions: list[dict]) -> dict:
+    """Calculate win/loss statistics by preflop action.
 
-    stats = {}
-    for action, data in action_data.items():
-        hands_count = data["hands"]
-        bb_100 = (data["bb_profit"] / hands_count * 100) if hands_count > 0 else 0
-        stats[action] = {
-            "profit": data["profit"],
-            "hands": hands_count,
-            "bb_profit": round(data["bb_profit"], 2),
-            "bb_100": round(bb_100, 2),
-        }
+    Args:
+        hands: List of hand dictionaries.
+        sessions: List of session dictionaries.
 
-    return stats
+    Returns:
+        Dictionary with action stats including BB/100, total profit, hand count.
+    """
+    results, bb_results = _hand_results(hands, sessions)
+    actions = [hand.get("action", "unknown") for hand in hands]
+
+    return _group_stats(actions, results, bb_results)
 
 
 def calculate_position_action_stats(hands: list[dict], sessions: list[dict]) -> dict:
@@ -119,38 +134,21 @@ def calculate_position_action_stats(hands: list[dict], sessions: list[dict]) ->
     Returns:
         Dictionary with combined position-action stats.
     """
-    session_stakes = {}
-    for s in sessions:
-        session_stakes[s.get("id")] = parse_stake_to_bb(s.get("stake", "1/2"))
+    results, bb_results = _hand_results(hands, sessions)
 
-    combo_data = defaultdict(lambda: {"profit": 0, "hands": 0, "bb_profit": 0})
+    return _position_action_stats(hands, results, bb_results)
 
-    for hand in hands:
-        pos = hand.get("position", "Unknown")
-        action = hand.get("action", "unknown")
-        result = hand.get("result", 0)
-        session_id = hand.get("session_id")
-        bb = session_stakes.get(session_id, 2.0)
 
-        key = f"{pos}_{action}"
-        combo_data[key]["profit"] += result
-        combo_data[key]["hands"] += 1
-        combo_data[key]["bb_profit"] += result / bb if bb > 0 else 0
-        combo_data[key]["position"] = pos
-        combo_data[key]["action"] = action
+def _position_action_stats(hands: list[dict], results: np.ndarray, bb_results: np.ndarray) -> dict:
+    """calculate_position_action_stats() on already-converted hand results."""
+    combos = [
+        (hand.get("position", "Unknown"), hand.get("action", "unknown"))
+        for hand in hands
+    ]
 
     stats = {}
-    for key, data in combo_data.items():
-        hands_count = data["hands"]
-        bb_100 = (data["bb_profit"] / hands_count * 100) if hands_count > 0 else 0
-        stats[key] = {
-            "position": data["position"],
-            "action": data["action"],
-            "profit": data["profit"],
-            "hands": hands_count,
-            "bb_profit": round(data["bb_profit"], 2),
-            "bb_100": round(bb_100, 2),
-        }
+    for (pos, action), data in _group_stats(combos, results, bb_results).items():
+        stats[f"{pos}_{action}"] = {"position": pos, "action": action, **data}
 
     return stats
 
@@ -176,6 +174,11 @@ def find_leaks(
     combo_stats = calculate_position_action_stats(hands, sessions)
     position_stats = calculate_position_stats(hands, sessions)
 
+    return _leaks_from_stats(combo_stats, position_stats, min_hands)
+
+
+def _leaks_from_stats(combo_stats: dict, position_stats: dict, min_hands: int) -> list[dict]:
+    """find_leaks() on already-aggregated position/action stats."""
     leaks = []
 
     # Check position-action combinations
@@ -233,6 +236,11 @@ def find_exploits(
     combo_stats = calculate_position_action_stats(hands, sessions)
     position_stats = calculate_position_stats(hands, sessions)
 
+    return _exploits_from_stats(combo_stats, position_stats, min_hands)
+
+
+def _exploits_from_stats(combo_stats: dict, position_stats: dict, min_hands: int) -> list[dict]:
+    """find_exploits() on already-aggregated position/action stats."""
     exploits = []
 
     # Check position-action combinations
@@ -363,21 +371,19 @@ def get_edge_summary(
             "overall_bb_100": 0,
         }
 
-    exploits = find_exploits(hands, sessions)[:max_items]
-    leaks = find_leaks(hands, sessions)[:max_items]
+    # Aggregate once and share it between exploits, leaks and the overall rate
+    results, bb_results = _hand_results(hands, sessions)
+    position_stats = _group_stats(
+        [hand.get("position", "Unknown") for hand in hands], results, bb_results
+    )
+    combo_stats = _position_action_stats(hands, results, bb_results)
+
+    exploits = _exploits_from_stats(combo_stats, position_stats, 5)[:max_items]
+    leaks = _leaks_from_stats(combo_stats, position_stats, 5)[:max_items]
     recommendations = generate_leak_recommendations(leaks)[:max_items]
 
     # Calculate overall BB/100
-    session_stakes = {}
-    for s in sessions:
-        session_stakes[s.get("id")] = parse_stake_to_bb(s.get("stake", "1/2"))
-
-    total_bb_profit = 0
-    for hand in hands:
-        result = hand.get("result", 0)
-        session_id = hand.get("session_id")
-        bb = session_stakes.get(session_id, 2.0)
-        total_bb_profit += result / bb if bb > 0 else 0
+    total_bb_profit = float(bb_results.sum())
 
     overall_bb_100 = (total_bb_profit / len(hands) * 100) if hands else 0
 
@@ -198,6 +198,52 @@ def save_hand(hand: dict, session_id: int) -> bool:
         return False
 
 
+def save_hands(new_hands: list[dict], session_id: int) -> int:
+    """
+    Save several new hands to the hands JSON file in a single write.
+
+    Args:
+        new_hands: List of hand data dictionaries.
+        session_id: The session ID these hands belong to.
+
+    Returns:
+        int: Number of hands saved (0 if the write failed).
+    """
+    if not new_hands:
+        return 0
+
+    try:
+        from datetime import datetime
+
+        # Load existing hands
+        hands = []
+        if HANDS_FILE.exists():
+            with open(HANDS_FILE, 'r') as f:
+                hands = json.load(f)
+
+        # Generate IDs
+        max_id = max((h.get("id", 0) for h in hands), default=0)
+        timestamp = datetime.now().isoformat()
+
+        for offset, hand in enumerate(new_hands, start=1):
+            hand["id"] = max_id + offset
+            hand["session_id"] = session_id
+            hand["timestamp"] = timestamp
+
+        # Append and save once
+        hands.extend(new_hands)
+
+        # Ensure data directory exists
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+        with open(HANDS_FILE, 'w') as f:
+            json.dump(hands, f, indent=2)
+
+        return len(new_hands)
+    except Exception:
+        return 0
+
+
 def load_hands(session_id: int | None = None) -> list[dict]:
     """
     Load hands from JSON file, optionally filtered by session.
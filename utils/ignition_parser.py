@@ -11,7 +11,8 @@ Supports:
 
 import re
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Union
 
 
 # Card conversion for Ignition format
@@ -36,6 +37,47 @@ POSITION_MAP_9MAX = {
     5: 'MP', 6: 'MP+1', 7: 'HJ', 8: 'CO'
 }
 
+# Compiled once at import; parse_single_hand runs these for every hand
+HAND_ID_PATTERN = re.compile(r'Hand #(\d+)')
+DATE_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})')
+STAKE_PATTERN = re.compile(r'\$[\d.]+/\$[\d.]+')
+TABLE_SIZE_PATTERN = re.compile(r'(\d+)-max', re.IGNORECASE)
+BUTTON_PATTERN = re.compile(r'Seat #(\d+) is the button')
+HERO_CARDS_PATTERN = re.compile(
+    r'Card dealt to a\]spot \[([^\]]+)\]|'
+    r'\[ME\]\s*:\s*Card dealt to a spot \[([^\]]+)\]|'
+    r'Dealt to \[ME\] \[([^\]]+)\]|'
+    r'Card dealt to a spot \[([^\]]+)\]',
+    re.IGNORECASE
+)
+HERO_CARDS_FALLBACK_PATTERN = re.compile(r'\[ME\].*?(\[[A-Za-z0-9]{2}\s+[A-Za-z0-9]{2}\])')
+HERO_SEAT_PATTERN = re.compile(r'Seat (\d+):\s*\[ME\]', re.IGNORECASE)
+HERO_STACK_PATTERN = re.compile(r'Seat \d+:.*?\[ME\].*?\(\$?([\d.]+)\s+in chips\)', re.IGNORECASE)
+FLOP_MARKER_PATTERN = re.compile(r'\*\*\* FLOP \*\*\*')
+FLOP_PATTERN = re.compile(r'\*\*\* FLOP \*\*\* \[([^\]]+)\]')
+TURN_PATTERN = re.compile(r'\*\*\* TURN \*\*\* \[[^\]]+\] \[([^\]]+)\]')
+RIVER_PATTERN = re.compile(r'\*\*\* RIVER \*\*\* \[[^\]]+\] \[([^\]]+)\]')
+STREET_PATTERNS = [
+    ('flop', re.compile(r'\*\*\* FLOP \*\*\*.*?(?=\*\*\* TURN|\*\*\* SUMMARY|$)', re.DOTALL | re.IGNORECASE)),
+    ('turn', re.compile(r'\*\*\* TURN \*\*\*.*?(?=\*\*\* RIVER|\*\*\* SUMMARY|$)', re.DOTALL | re.IGNORECASE)),
+    ('river', re.compile(r'\*\*\* RIVER \*\*\*.*?(?=\*\*\* SUMMARY|$)', re.DOTALL | re.IGNORECASE)),
+]
+
+# Every hero money line in one scan; the named group says which kind it is.
+# Raises count the "to" amount (the total bet on that street).
+HERO_MONEY_PATTERN = re.compile(
+    r'\[ME\]\s*:\s*(?:'
+    r'(?:Small Blind|Big blind|Posts chip)\s*\$?(?P<blind>[\d.]+)'
+    r'|Calls?\s*\$?(?P<call>[\d.]+)'
+    r'|Bets?\s*\$?(?P<bet>[\d.]+)'
+    r'|All-in\s*\$?(?P<allin>[\d.]+)'
+    r'|Raises\s*\$?[\d.]+\s+to\s+\$?(?P<raise>[\d.]+)'
+    r'|Return uncalled portion of bet\s*\$?(?P<returned>[\d.]+)'
+    r'|Hand result\s*\$?(?P<won>[\d.]+)'
+    r')',
+    re.IGNORECASE
+)
+
 
 def parse_card(card_str: str) -> Optional[tuple[str, str]]:
     """Parse a card string like 'Ah' or '10s' into (rank, suit) tuple.
@@ -140,6 +182,12 @@ def determine_position(seat_num: int, button_seat: int, num_seats: int) -> str:
         return POSITION_MAP_9MAX.get(relative_pos, 'Unknown')
 
 
+@lru_cache(maxsize=None)
+def _hero_action_pattern(hero_name: str) -> re.Pattern:
+    """Compiled pattern for the first word of each of hero's action lines."""
+    return re.compile(re.escape(hero_name) + r'\s*:\s*(\w+)', re.IGNORECASE)
+
+
 def extract_preflop_action(hand_text: str, hero_name: str) -> str:
     """Extract hero's preflop action from hand text.
 
@@ -151,15 +199,14 @@ def extract_preflop_action(hand_text: str, hero_name: str) -> str:
         Action string: 'raise', 'call', 'fold', 'check', 'all-in'
     """
     # Find preflop section (before FLOP or end if no flop)
-    flop_match = re.search(r'\*\*\* FLOP \*\*\*', hand_text)
+    flop_match = FLOP_MARKER_PATTERN.search(hand_text)
     if flop_match:
         preflop_section = hand_text[:flop_match.start()]
     else:
         preflop_section = hand_text
 
     # Look for hero's actions in preflop
-    hero_pattern = re.escape(hero_name) + r'\s*:\s*(\w+)'
-    actions = re.findall(hero_pattern, preflop_section, re.IGNORECASE)
+    actions = _hero_action_pattern(hero_name).findall(preflop_section)
 
     # Determine primary action (ignore posting blinds)
     for action in actions:
@@ -190,19 +237,13 @@ def extract_street_actions(hand_text: str, hero_name: str) -> dict:
     """
     actions = {}
 
-    # Define street patterns
-    streets = [
-        ('flop', r'\*\*\* FLOP \*\*\*.*?(?=\*\*\* TURN|\*\*\* SUMMARY|$)'),
-        ('turn', r'\*\*\* TURN \*\*\*.*?(?=\*\*\* RIVER|\*\*\* SUMMARY|$)'),
-        ('river', r'\*\*\* RIVER \*\*\*.*?(?=\*\*\* SUMMARY|$)'),
-    ]
+    hero_pattern = _hero_action_pattern(hero_name)
 
-    for street_name, pattern in streets:
-        match = re.search(pattern, hand_text, re.DOTALL | re.IGNORECASE)
+    for street_name, pattern in STREET_PATTERNS:
+        match = pattern.search(hand_text)
         if match:
             section = match.group(0)
-            hero_pattern = re.escape(hero_name) + r'\s*:\s*(\w+)'
-            hero_actions = re.findall(hero_pattern, section, re.IGNORECASE)
+            hero_actions = hero_pattern.findall(section)
 
             for action in hero_actions:
                 action_lower = action.lower()
@@ -236,16 +277,13 @@ def parse_single_hand(hand_text: str) -> Optional[dict]:
     """
     try:
         # Extract hand ID
-        hand_id_match = re.search(r'Hand #(\d+)', hand_text)
+        hand_id_match = HAND_ID_PATTERN.search(hand_text)
         if not hand_id_match:
             return None
         hand_id = hand_id_match.group(1)
 
         # Extract date/time - Ignition uses YYYY-MM-DD format
-        date_match = re.search(
-            r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})',
-            hand_text
-        )
+        date_match = DATE_PATTERN.search(hand_text)
         if date_match:
             date_str = date_match.group(1)
             try:
@@ -256,33 +294,23 @@ def parse_single_hand(hand_text: str) -> Optional[dict]:
             hand_date = datetime.now()
 
         # Extract stakes
-        stake_match = re.search(r'\$[\d.]+/\$[\d.]+', hand_text)
+        stake_match = STAKE_PATTERN.search(hand_text)
         stake = parse_stake(stake_match.group(0)) if stake_match else '0.05/0.10'
 
         # Extract table info (6-max or 9-max)
-        table_match = re.search(r'(\d+)-max', hand_text, re.IGNORECASE)
+        table_match = TABLE_SIZE_PATTERN.search(hand_text)
         num_seats = int(table_match.group(1)) if table_match else 6
 
         # Find button seat
-        button_match = re.search(r'Seat #(\d+) is the button', hand_text)
+        button_match = BUTTON_PATTERN.search(hand_text)
         button_seat = int(button_match.group(1)) if button_match else 1
 
         # Find hero (marked as [ME] in Ignition)
-        hero_cards_match = re.search(
-            r'Card dealt to a\]spot \[([^\]]+)\]|'
-            r'\[ME\]\s*:\s*Card dealt to a spot \[([^\]]+)\]|'
-            r'Dealt to \[ME\] \[([^\]]+)\]|'
-            r'Card dealt to a spot \[([^\]]+)\]',
-            hand_text,
-            re.IGNORECASE
-        )
+        hero_cards_match = HERO_CARDS_PATTERN.search(hand_text)
 
         if not hero_cards_match:
             # Try alternate pattern
-            hero_cards_match = re.search(
-                r'\[ME\].*?(\[[A-Za-z0-9]{2}\s+[A-Za-z0-9]{2}\])',
-                hand_text
-            )
+            hero_cards_match = HERO_CARDS_FALLBACK_PATTERN.search(hand_text)
 
         if not hero_cards_match:
             return None
@@ -300,20 +328,12 @@ def parse_single_hand(hand_text: str) -> Optional[dict]:
             return None
 
         # Find hero's seat
-        hero_seat_match = re.search(
-            r'Seat (\d+):\s*\[ME\]',
-            hand_text,
-            re.IGNORECASE
-        )
+        hero_seat_match = HERO_SEAT_PATTERN.search(hand_text)
         hero_seat = int(hero_seat_match.group(1)) if hero_seat_match else 1
 
         # Extract hero's stack size
         # Format: "Seat 4: UTG [ME] ($25 in chips)" or "Seat 4: [ME] ($25 in chips)"
-        stack_match = re.search(
-            r'Seat \d+:.*?\[ME\].*?\(\$?([\d.]+)\s+in chips\)',
-            hand_text,
-            re.IGNORECASE
-        )
+        stack_match = HERO_STACK_PATTERN.search(hand_text)
         stack_size = parse_money(stack_match.group(1)) if stack_match else 0.0
 
         # Determine position
@@ -322,87 +342,37 @@ def parse_single_hand(hand_text: str) -> Optional[dict]:
         # Extract board cards
         board = {'flop': [], 'turn': [], 'river': []}
 
-        flop_match = re.search(r'\*\*\* FLOP \*\*\* \[([^\]]+)\]', hand_text)
+        flop_match = FLOP_PATTERN.search(hand_text)
         if flop_match:
             board['flop'] = parse_cards(flop_match.group(1))
 
-        turn_match = re.search(r'\*\*\* TURN \*\*\* \[[^\]]+\] \[([^\]]+)\]', hand_text)
+        turn_match = TURN_PATTERN.search(hand_text)
         if turn_match:
             board['turn'] = parse_cards(turn_match.group(1))
 
-        river_match = re.search(r'\*\*\* RIVER \*\*\* \[[^\]]+\] \[([^\]]+)\]', hand_text)
+        river_match = RIVER_PATTERN.search(hand_text)
         if river_match:
             board['river'] = parse_cards(river_match.group(1))
 
-        # Extract result (profit/loss)
-        # Step 1: Calculate total invested by hero
+        # Extract result (profit/loss) from hero's money lines in one pass
+        # Invested = blinds/posts + calls + bets + all-ins + raise-to amounts,
+        # minus any uncalled portion returned
         invested = 0.0
-
-        # Match blinds and posts
-        blind_matches = re.findall(
-            r'\[ME\]\s*:\s*(?:Small Blind|Big blind|Posts chip)\s*\$?([\d.]+)',
-            hand_text,
-            re.IGNORECASE
-        )
-        for m in blind_matches:
-            invested += parse_money(m)
-
-        # Match calls
-        call_matches = re.findall(
-            r'\[ME\]\s*:\s*Calls?\s*\$?([\d.]+)',
-            hand_text,
-            re.IGNORECASE
-        )
-        for m in call_matches:
-            invested += parse_money(m)
-
-        # Match bets
-        bet_matches = re.findall(
-            r'\[ME\]\s*:\s*Bets?\s*\$?([\d.]+)',
-            hand_text,
-            re.IGNORECASE
-        )
-        for m in bet_matches:
-            invested += parse_money(m)
-
-        # Match all-ins
-        allin_matches = re.findall(
-            r'\[ME\]\s*:\s*All-in\s*\$?([\d.]+)',
-            hand_text,
-            re.IGNORECASE
-        )
-        for m in allin_matches:
-            invested += parse_money(m)
-
-        # Match raises - "Raises $X to $Y" means total bet is Y on that street
-        # We need the "to" amount, not the raise amount
-        raise_matches = re.findall(
-            r'\[ME\]\s*:\s*Raises\s*\$?[\d.]+\s+to\s+\$?([\d.]+)',
-            hand_text,
-            re.IGNORECASE
-        )
-        for m in raise_matches:
-            invested += parse_money(m)
-
-        # Step 2: Subtract returned uncalled bets
-        return_matches = re.findall(
-            r'\[ME\]\s*:\s*Return uncalled portion of bet\s*\$?([\d.]+)',
-            hand_text,
-            re.IGNORECASE
-        )
-        for m in return_matches:
-            invested -= parse_money(m)
-
-        # Step 3: Determine win or loss
-        # "Hand result $X" = total pot won (not profit!)
-        # Profit = pot won - amount invested
-        win_match = re.search(
-            r'\[ME\]\s*:\s*Hand result\s*\$?([\d.]+)',
-            hand_text,
-            re.IGNORECASE
-        )
-        if win_match:
-            pot_won = parse_money(win_match.group(1))
+        pot_won = None
+
+        for m in HERO_MONEY_PATTERN.finditer(hand_text):
+            kind = m.lastgroup
+            amount = parse_money(m.group(kind))
+            if kind == 'returned':
+                invested -= amount
+            elif kind == 'won':
+                # "Hand result $X" = total pot won (not profit!); first one counts
+                if pot_won is None:
+                    pot_won = amount
+            else:
+                invested += amount
+
+        if pot_won is not None:
             result = pot_won - invested  # Profit = won - invested
         else:
             # No "Hand result" = hero lost (folded or lost at showdown)
@@ -436,23 +406,55 @@ def parse_single_hand(hand_text: str) -> Optional[dict]:
         return None
 
 
-def parse_ignition_file(file_content: str) -> list[dict]:
+# Start of each hand; Ignition hands begin with "Ignition Hand #"
+HAND_HEADER_PATTERN = re.compile(r'(?:Ignition|Bovada)\s+Hand\s+#\d+', re.IGNORECASE)
+
+
+def iter_hand_texts(lines: Iterable[str]) -> Iterator[str]:
+    """Split hand history lines into the text of each hand.
+
+    Args:
+        lines: Lines of a hand history file (e.g. an open text file)
+
+    Yields:
+        Text of each hand, from its header up to the next hand's header
+    """
+    current = None
+
+    for line in lines:
+        start = 0
+        for match in HAND_HEADER_PATTERN.finditer(line):
+            # Anything before a new header belongs to the previous hand
+            if current is not None:
+                current.append(line[start:match.start()])
+                yield ''.join(current)
+            current = []
+            start = match.start()
+
+        # Text before the first header isn't part of any hand
+        if current is not None:
+            current.append(line[start:])
+
+    if current is not None:
+        yield ''.join(current)
+
+
+def parse_ignition_file(file_content: Union[str, Iterable[str]]) -> list[dict]:
     """Parse an Ignition hand history file and extract all hands.
 
     Args:
-        file_content: Full text content of the hand history file
+        file_content: Full text of the hand history file, or an iterable
+            of its lines (e.g. an open text file) to parse hand by hand
 
     Returns:
         List of parsed hand dictionaries
     """
-    hands = []
+    if isinstance(file_content, str):
+        file_content = file_content.splitlines(keepends=True)
 
-    # Split file into individual hands
-    # Ignition hands are separated by blank lines and start with "Ignition Hand #"
-    hand_pattern = r'(?:Ignition|Bovada)\s+Hand\s+#\d+.*?(?=(?:Ignition|Bovada)\s+Hand\s+#|\Z)'
-    hand_texts = re.findall(hand_pattern, file_content, re.DOTALL | re.IGNORECASE)
+    hands = []
 
-    for hand_text in hand_texts:
+    for hand_text in iter_hand_texts(file_content):
         parsed = parse_single_hand(hand_text)
         if parsed:
             hands.append(parsed)
@@ -480,17 +482,36 @@ def get_import_summary(hands: list[dict]) -> dict:
             'date_range': None,
         }
 
-    total_profit = sum(h.get('result', 0) for h in hands)
-    winning = sum(1 for h in hands if h.get('result', 0) > 0)
-    losing = sum(1 for h in hands if h.get('result', 0) < 0)
-    breakeven = len(hands) - winning - losing
+    # One pass for the totals, stakes and first/last date
+    total_profit = 0
+    winning = 0
+    losing = 0
+    stakes = set()
+    first_date = None
+    last_date = None
+
+    for h in hands:
+        result = h.get('result', 0)
+        total_profit += result
+        if result > 0:
+            winning += 1
+        elif result < 0:
+            losing += 1
+
+        stakes.add(h.get('stake', 'Unknown'))
+
+        date = h.get('date')
+        if date:
+            if first_date is None or date < first_date:
+                first_date = date
+            if last_date is None or date > last_date:
+                last_date = date
 
-    stakes = list(set(h.get('stake', 'Unknown') for h in hands))
+    breakeven = len(hands) - winning - losing
+    stakes = list(stakes)
 
-    dates = [h.get('date') for h in hands if h.get('date')]
-    if dates:
-        dates.sort()
-        date_range = f"{dates[0][:10]} to {dates[-1][:10]}"
+    if first_date:
+        date_range = f"{first_date[:10]} to {last_date[:10]}"
     else:
         date_range = None
 
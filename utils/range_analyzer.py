@@ -5,9 +5,15 @@ Range Analyzer - Calculate and visualize playing ranges from hand history.
 from typing import Optional
 from collections import defaultdict
 
+import numpy as np
+
 # Standard 13x13 hand matrix layout
 RANKS = ['A', 'K', 'Q', 'J', 'T', '9', '8', '7', '6', '5', '4', '3', '2']
 
+# Rank -> matrix index (0 = A .. 12 = 2); '10' is accepted as T
+RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+RANK_INDEX['10'] = RANK_INDEX['T']
+
 # All possible starting hands in matrix format
 # Pairs on diagonal, suited above, offsuit below
 def get_hand_matrix_position(card1: tuple, card2: tuple) -> tuple[int, int, str]:
@@ -20,15 +26,10 @@ def get_hand_matrix_position(card1: tuple, card2: tuple) -> tuple[int, int, str]
     rank1, suit1 = card1
     rank2, suit2 = card2
 
-    # Normalize ranks (T for 10)
-    r1 = rank1 if rank1 != '10' else 'T'
-    r2 = rank2 if rank2 != '10' else 'T'
-
     # Get rank indices
-    try:
-        idx1 = RANKS.index(r1)
-        idx2 = RANKS.index(r2)
-    except ValueError:
+    idx1 = RANK_INDEX.get(rank1)
+    idx2 = RANK_INDEX.get(rank2)
+    if idx1 is None or idx2 is None:
         return (-1, -1, 'unknown')
 
     is_suited = suit1 == suit2
@@ -58,6 +59,10 @@ def get_hand_name(row: int, col: int) -> str:
         return f"{RANKS[col]}{RANKS[row]}o"
 
 
+# Hand names for every matrix cell, built once
+HAND_NAMES = [[get_hand_name(row, col) for col in range(13)] for row in range(13)]
+
+
 def analyze_ranges(hands: list[dict], position_filter: Optional[str] = None) -> dict:
     """
     Analyze hands to build range data.
@@ -76,20 +81,17 @@ def analyze_ranges(hands: list[dict], position_filter: Optional[str] = None) ->
             'summary': str
         }
     """
-    # Initialize 13x13 matrix
-    matrix = [[{
-        'count': 0,
-        'profit': 0.0,
-        'vpip': 0,
-        'pfr': 0,
-        'won': 0,
-        'actions': defaultdict(int)
-    } for _ in range(13)] for _ in range(13)]
-
     total_hands = 0
     vpip_hands = 0
     positions = defaultdict(int)
 
+    # One pass to pull the per-hand columns; the per-cell sums are done below
+    cells = []
+    results = []
+    vpip_flags = []
+    pfr_flags = []
+    cell_actions = defaultdict(int)
+
     for hand in hands:
         hole_cards = hand.get('hole_cards', [])
         position = hand.get('position', 'Unknown')
@@ -108,7 +110,8 @@ def analyze_ranges(hands: list[dict], position_filter: Optional[str] = None) ->
         positions[position] += 1
 
         # Determine VPIP (voluntary put money in pot)
-        is_vpip = action.lower() not in ['fold', 'check', 'unknown']
+        action_lower = action.lower()
+        is_vpip = action_lower not in ['fold', 'check', 'unknown']
         if is_vpip:
             vpip_hands += 1
 
@@ -118,17 +121,34 @@ def analyze_ranges(hands: list[dict], position_filter: Optional[str] = None) ->
         if row < 0 or col < 0:
             continue
 
-        # Update matrix cell
-        cell = matrix[row][col]
-        cell['count'] += 1
-        cell['profit'] += result
-        if is_vpip:
-            cell['vpip'] += 1
-        if action.lower() in ['raise', '3bet', '4bet', 'all-in']:
-            cell['pfr'] += 1
-        if result > 0:
-            cell['won'] += 1
-        cell['actions'][action] += 1
+        cell = row * 13 + col
+        cells.append(cell)
+        results.append(result)
+        vpip_flags.append(is_vpip)
+        pfr_flags.append(action_lower in ['raise', '3bet', '4bet', 'all-in'])
+        cell_actions[(cell, action)] += 1
+
+    # Per-cell totals over the flattened 13x13 grid
+    cells = np.asarray(cells, dtype=np.intp)
+    results = np.asarray(results, dtype=np.float64)
+    counts = np.bincount(cells, minlength=169).tolist()
+    # astype keeps profit a float when no hands matched (bincount gives ints)
+    profits = np.bincount(cells, weights=results, minlength=169).astype(np.float64).tolist()
+    vpips = np.bincount(cells, weights=np.asarray(vpip_flags, dtype=np.float64), minlength=169)
+    pfrs = np.bincount(cells, weights=np.asarray(pfr_flags, dtype=np.float64), minlength=169)
+    wins = np.bincount(cells, weights=(results > 0).astype(np.float64), minlength=169)
+
+    matrix = [[{
+        'count': counts[i],
+        'profit': profits[i],
+        'vpip': int(vpips[i]),
+        'pfr': int(pfrs[i]),
+        'won': int(wins[i]),
+        'actions': defaultdict(int)
+    } for i in range(r * 13, r * 13 + 13)] for r in range(13)]
+
+    for (cell, action), n in cell_actions.items():
+        matrix[cell // 13][cell % 13]['actions'][action] = n
 
     return {
         'matrix': matrix,
@@ -156,7 +176,7 @@ def get_range_grid_data(matrix: list, mode: str = 'frequency') -> list[list[dict
     for row_idx, row in enumerate(matrix):
         grid_row = []
         for col_idx, cell in enumerate(row):
-            hand_name = get_hand_name(row_idx, col_idx)
+            hand_name = HAND_NAMES[row_idx][col_idx]
             count = cell['count']
             profit = cell['profit']
             vpip = cell['vpip']